@@ -3,17 +3,13 @@ Azure Functions Boot - A powerful framework for building Azure Functions applica
 with built-in dependency injection and hexagonal architecture support.
 """
 
-# Bootstrap
-from azfunc_boot.bootstrap.app_factory import AppFactory, create_app
+import importlib
+from typing import TYPE_CHECKING
 
 # Dependency Injection
 from azfunc_boot.di.dependency_injector import DependencyContainer
 from azfunc_boot.di.scope import ScopeManager
 
-# MVC
-from azfunc_boot.mvc.base_controller import BaseController
-from azfunc_boot.mvc.controller_discovery import ControllerDiscovery
-
 # Registry
 from azfunc_boot.registry.base_service_registry import (
     BaseServiceRegistry,
@@ -26,9 +22,38 @@ from azfunc_boot.common.disposable import IDisposable
 from azfunc_boot.common.exceptions.not_found_error import NotFoundError
 from azfunc_boot.common.exceptions.validation_error import ValidationError
 from azfunc_boot.config.configuration import Configuration
+
+if TYPE_CHECKING:
+    from azfunc_boot.bootstrap.app_factory import AppContext, AppFactory, create_app
+    from azfunc_boot.mvc.base_controller import BaseController
+    from azfunc_boot.mvc.controller_discovery import ControllerDiscovery
+
+# Exports that depend on azure.functions are imported on first access,
+# so importing the framework does not pay for loading it
+_LAZY_EXPORTS = {
+    # Bootstrap
+    "AppContext": "azfunc_boot.bootstrap.app_factory",
+    "AppFactory": "azfunc_boot.bootstrap.app_factory",
+    "create_app": "azfunc_boot.bootstrap.app_factory",
+    # MVC
+    "BaseController": "azfunc_boot.mvc.base_controller",
+    "ControllerDiscovery": "azfunc_boot.mvc.controller_discovery",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 __version__ = "0.1.0"
 __all__ = [
     # Bootstrap
+    "AppContext",
     "AppFactory",
     "create_app",
     # Dependency Injection
@@ -1,12 +1,13 @@
 import asyncio
 import logging
-from typing import Optional, Callable, Tuple
-
-import azure.functions as func
+from typing import Optional, Callable, NamedTuple, TYPE_CHECKING
 
+from azfunc_boot.bootstrap.discovery_manifest import DiscoveryManifest
 from azfunc_boot.di.dependency_injector import DependencyContainer
 from azfunc_boot.registry.discovery import RegistryManager
-from azfunc_boot.mvc.controller_discovery import ControllerDiscovery
+
+if TYPE_CHECKING:
+    import azure.functions as func
 
 
 async def shutdown_container(container: DependencyContainer) -> None:
@@ -24,6 +25,28 @@ async def shutdown_container(container: DependencyContainer) -> None:
             logging.error(f"Error during container shutdown: {e}")
 
 
+class AppContext(NamedTuple):
+    """
+    Result of creating the app. Unpacks as (FunctionApp, DependencyContainer) and
+    can be used as an async context manager that shuts the container down on exit.
+
+    Example:
+        ```python
+        async with create_app() as (app, container):
+            ...
+        ```
+    """
+
+    app: "func.FunctionApp"
+    container: DependencyContainer
+
+    async def __aenter__(self) -> "AppContext":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await shutdown_container(self.container)
+
+
 class AppFactory:
     """
     Factory to create and configure an Azure Function App with the framework.
@@ -35,8 +58,9 @@ class AppFactory:
         registries_package: str = "registries",
         pre_setup_hook: Optional[Callable[[DependencyContainer], None]] = None,
         post_setup_hook: Optional[
-            Callable[[func.FunctionApp, DependencyContainer], None]
+            Callable[["func.FunctionApp", DependencyContainer], None]
         ] = None,
+        discovery_cache_dir: Optional[str] = None,
     ):
         """
         Args:
@@ -44,24 +68,30 @@ class AppFactory:
             registries_package: Name of the package where to search for registries (default: "registries").
             pre_setup_hook: Optional function to execute after creating the container but before registering services.
             post_setup_hook: Optional function to execute after registering everything but before returning.
+            discovery_cache_dir: Optional writable directory where discovery results are cached across cold starts.
         """
         self.controllers_package = controllers_package
         self.registries_package = registries_package
         self.pre_setup_hook = pre_setup_hook
         self.post_setup_hook = post_setup_hook
+        self.discovery_cache_dir = discovery_cache_dir
 
-    def create_app(self) -> Tuple[func.FunctionApp, DependencyContainer]:
+    def create_app(self) -> AppContext:
         """
         Creates and configures the Azure Function App with all framework components.
 
         Returns:
-            Tuple with (FunctionApp, DependencyContainer).
+            AppContext with (FunctionApp, DependencyContainer).
 
         Raises:
             Exception: If there is any error during configuration.
         """
         logging.info("Setting up Azure Function App with framework")
 
+        # Imported here so importing the framework does not load azure.functions
+        import azure.functions as func
+        from azfunc_boot.mvc.controller_discovery import ControllerDiscovery
+
         # 1. Create FunctionApp and Blueprint
         app = func.FunctionApp()
         blueprint = func.Blueprint()
@@ -77,24 +107,47 @@ class AppFactory:
                 logging.error(f"Error in pre_setup_hook: {e}")
                 raise
 
+        # Discovery manifest (optional) - skips package scanning on later cold starts
+        manifest = None
+        cached_classes = None
+        if self.discovery_cache_dir:
+            manifest = DiscoveryManifest(
+                self.discovery_cache_dir,
+                (self.registries_package, self.controllers_package),
+            )
+            cached_classes = manifest.load()
+
         # 4. Discover and register services from registries
         try:
-            RegistryManager.create_registry(container=container)
+            registry = RegistryManager.create_registry(
+                container=container,
+                registries_package=self.registries_package,
+                registry_classes=cached_classes["registries"] if cached_classes else None,
+            )
         except Exception as e:
             logging.error(f"Error discovering registries: {e}")
             raise
 
         # 5. Discover and register controllers
         try:
-            ControllerDiscovery.create(
+            discovery = ControllerDiscovery.create(
                 container=container,
                 blueprint=blueprint,
                 package=self.controllers_package,
+                controller_classes=cached_classes["controllers"] if cached_classes else None,
             )
         except Exception as e:
             logging.error(f"Error discovering controllers: {e}")
             raise
 
+        if manifest and not cached_classes:
+            manifest.save(
+                {
+                    "registries": [type(r) for r in registry.registered_services],
+                    "controllers": list(discovery.registered_controllers),
+                }
+            )
+
         # 6. Register blueprint in the app
         app.register_blueprint(blueprint)
 
@@ -106,8 +159,13 @@ class AppFactory:
                 logging.error(f"Error in post_setup_hook: {e}")
                 raise
 
+        # 8. Parse constructors of auto-injected services before the first request
+        # and freeze the container: no more registrations after setup
+        container.precompile()
+        container.freeze()
+
         logging.info("Azure Function App setup completed successfully")
-        return app, container
+        return AppContext(app, container)
 
 
 def create_app(
@@ -115,9 +173,10 @@ def create_app(
     registries_package: str = "registries",
     pre_setup_hook: Optional[Callable[[DependencyContainer], None]] = None,
     post_setup_hook: Optional[
-        Callable[[func.FunctionApp, DependencyContainer], None]
+        Callable[["func.FunctionApp", DependencyContainer], None]
     ] = None,
-) -> Tuple[func.FunctionApp, DependencyContainer]:
+    discovery_cache_dir: Optional[str] = None,
+) -> AppContext:
     """
     Convenience function to create an Azure Function App with the framework.
 
@@ -126,9 +185,10 @@ def create_app(
         registries_package: Name of the package where to search for registries.
         pre_setup_hook: Optional function to execute after creating the container.
         post_setup_hook: Optional function to execute after registering everything.
+        discovery_cache_dir: Optional writable directory to cache discovery results across cold starts.
 
     Returns:
-        Tuple with (FunctionApp, DependencyContainer).
+        AppContext with (FunctionApp, DependencyContainer).
 
     Example:
         ```python
@@ -143,5 +203,6 @@ def create_app(
         registries_package=registries_package,
         pre_setup_hook=pre_setup_hook,
         post_setup_hook=post_setup_hook,
+        discovery_cache_dir=discovery_cache_dir,
     )
     return factory.create_app()
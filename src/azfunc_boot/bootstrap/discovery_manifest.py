@@ -0,0 +1,158 @@
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, Tuple, Type
+
+
+class DiscoveryManifest:
+    """
+    Persists the registry and controller classes found during discovery so that
+    later cold starts can import them directly instead of scanning the packages.
+
+    The manifest file is keyed by a fingerprint of the package sources (paths and
+    modification times), so any change to those packages invalidates it. Classes
+    are stored as "module:qualname" strings in JSON and resolved by importing
+    their module, which must belong to one of the packages.
+    """
+
+    def __init__(self, cache_dir: str, packages: Tuple[str, ...]):
+        """
+        Args:
+            cache_dir: Directory where manifest files are stored.
+            packages: Names of the packages whose sources key the manifest.
+        """
+        self.cache_dir = cache_dir
+        self.packages = packages
+        self._path: Optional[str] = None
+
+    def load(self) -> Optional[Dict[str, List[Type]]]:
+        """
+        Loads the cached classes for the current package sources.
+
+        Returns:
+            Dictionary of discovered classes by role, or None if there is no valid manifest.
+        """
+        path = self._manifest_path()
+        if path is None or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, "r", encoding="utf-8") as manifest_file:
+                names = json.load(manifest_file)
+            return {
+                role: [self._resolve_class(name) for name in class_names]
+                for role, class_names in names.items()
+            }
+        except Exception as e:
+            logging.warning(
+                f"Could not load discovery manifest '{path}': {e}. "
+                "Falling back to package discovery."
+            )
+            return None
+
+    def save(self, classes: Dict[str, List[Type]]) -> None:
+        """
+        Stores the discovered classes for the current package sources. Nothing is
+        stored when a class is defined outside the packages.
+
+        Args:
+            classes: Dictionary of discovered classes by role (e.g.: "registries", "controllers").
+        """
+        path = self._manifest_path()
+        if path is None:
+            return
+
+        names = {
+            role: [f"{cls.__module__}:{cls.__qualname__}" for cls in role_classes]
+            for role, role_classes in classes.items()
+        }
+        if not all(
+            self._in_packages(name.partition(":")[0])
+            for class_names in names.values()
+            for name in class_names
+        ):
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as manifest_file:
+                json.dump(names, manifest_file)
+        except Exception as e:
+            logging.warning(f"Could not write discovery manifest '{path}': {e}")
+
+    def _in_packages(self, module_name: str) -> bool:
+        return any(
+            module_name == package or module_name.startswith(package + ".")
+            for package in self.packages
+        )
+
+    def _resolve_class(self, name: str) -> Type:
+        """
+        Imports the class named by a "module:qualname" string.
+
+        Raises:
+            ValueError: If the module is outside the packages or the name is not a class.
+        """
+        module_name, _, qualname = name.partition(":")
+        if not qualname or not self._in_packages(module_name):
+            raise ValueError(f"Unexpected class name '{name}'")
+
+        obj = importlib.import_module(module_name)
+        for attribute in qualname.split("."):
+            obj = getattr(obj, attribute)
+        if not isinstance(obj, type):
+            raise ValueError(f"'{name}' is not a class")
+        return obj
+
+    def _manifest_path(self) -> Optional[str]:
+        """
+        Builds the manifest file path from the fingerprint of the package sources.
+
+        Returns:
+            Manifest path, or None if any package cannot be located.
+        """
+        if self._path is None:
+            fingerprint = self._fingerprint()
+            if fingerprint is not None:
+                self._path = os.path.join(self.cache_dir, f"{fingerprint}.json")
+        return self._path
+
+    def _fingerprint(self) -> Optional[str]:
+        """
+        Hashes the path and modification time of every Python source in the packages,
+        along with the Python version the manifest is written with.
+        """
+        digest = hashlib.sha256()
+        digest.update(sys.version.encode())
+        for package in self.packages:
+            try:
+                spec = importlib.util.find_spec(package)
+            except (ImportError, ValueError):
+                return None
+
+            locations = spec.submodule_search_locations if spec else None
+            if not locations:
+                return None
+
+            digest.update(package.encode())
+            for location in locations:
+                self._hash_sources(digest, location)
+
+        return digest.hexdigest()
+
+    def _hash_sources(self, digest, directory: str) -> None:
+        """
+        Adds the sources under 'directory' to the digest. os.scandir returns the
+        entry types with the listing, so only the .py files are stat'ed.
+        """
+        with os.scandir(directory) as entries:
+            entries = sorted(entries, key=lambda entry: entry.name)
+        for entry in entries:
+            if entry.is_dir() and entry.name != "__pycache__":
+                self._hash_sources(digest, entry.path)
+            elif entry.name.endswith(".py") and entry.is_file():
+                digest.update(f"{entry.path}:{entry.stat().st_mtime_ns}".encode())
@@ -0,0 +1,23 @@
+import asyncio
+import functools
+from typing import Any, Callable
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_coroutine_function(func: Callable[..., Any]) -> bool:
+    return asyncio.iscoroutinefunction(func)
+
+
+def is_async_callable(func: Callable[..., Any]) -> bool:
+    """
+    Cached equivalent of asyncio.iscoroutinefunction.
+
+    Bound methods are keyed by their underlying function, so the check runs
+    once per method rather than once per instance.
+    """
+    target = getattr(func, "__func__", func)
+    try:
+        return _is_coroutine_function(target)
+    except TypeError:
+        # Unhashable callables cannot be cached
+        return asyncio.iscoroutinefunction(func)
@@ -1,7 +1,52 @@
-from typing import Protocol, runtime_checkable
+import asyncio
+from typing import Any, Iterable, Optional, Protocol, runtime_checkable
 
 
 @runtime_checkable
 class IDisposable(Protocol):
     def dispose(self) -> None:
         ...
+
+
+def is_disposable(instance: Any) -> bool:
+    """
+    Structural IDisposable check: True when the class of 'instance' defines a
+    callable dispose(). Called once, when the framework creates the instance.
+    """
+    return callable(getattr(type(instance), "dispose", None))
+
+
+def dispose_sync(sync_disposables: Iterable[Any]) -> Optional[Exception]:
+    """
+    Calls every sync dispose(), even when an earlier one fails.
+
+    Returns:
+        The first error raised, or None.
+    """
+    first_error = None
+    for instance in sync_disposables:
+        try:
+            instance.dispose()
+        except Exception as e:
+            if first_error is None:
+                first_error = e
+    return first_error
+
+
+async def dispose_all(
+    sync_disposables: Iterable[Any], async_disposables: Iterable[Any]
+) -> None:
+    """
+    Runs the sync disposes, then the async ones concurrently. Every dispose runs
+    even when another fails; the first error is re-raised once all finish.
+    """
+    first_error = dispose_sync(sync_disposables)
+    results = await asyncio.gather(
+        *(instance.dispose() for instance in async_disposables),
+        return_exceptions=True,
+    )
+    for result in results:
+        if first_error is None and isinstance(result, BaseException):
+            first_error = result
+    if first_error is not None:
+        raise first_error
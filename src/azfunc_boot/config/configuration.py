@@ -1,13 +1,60 @@
 import os
+from collections.abc import Mapping
 
 
-class Configuration(dict):
+class Configuration(Mapping):
+    __slots__ = ("_env", "_lower_index", "_indexed_size", "_resolved")
+
     def __init__(self):
-        super().__init__(os.environ)
+        # Read-only view over the environment, no copy is made
+        self._env = os.environ
+        # Case-insensitive index of the environment keys, rebuilt on a miss when
+        # the number of variables changed, so variables set after the first
+        # lookup are still found without rebuilding on every absent key
+        self._lower_index = {}
+        self._indexed_size = -1
+        # Keys already resolved to an environment key. Misses are never stored
+        self._resolved = {}
+
+    def _resolve_key(self, key):
+        env_key = self._resolved.get(key)
+        if env_key is not None:
+            return env_key
 
-    def __getitem__(self, key):
         key_lower = key.lower()
-        for k, v in self.items():
-            if k.lower() == key_lower:
-                return v
-        return None
+        env_key = self._lower_index.get(key_lower)
+        if env_key is None or env_key not in self._env:
+            if len(self._env) == self._indexed_size and env_key is None:
+                return None
+            self._lower_index = {k.lower(): k for k in self._env}
+            self._indexed_size = len(self._env)
+            env_key = self._lower_index.get(key_lower)
+            if env_key is None:
+                return None
+        self._resolved[key] = env_key
+        return env_key
+
+    def __getitem__(self, key):
+        env_key = self._resolve_key(key)
+        if env_key is None:
+            return None
+        value = self._env.get(env_key)
+        if value is None:
+            # The variable was removed since it was resolved
+            self._resolved.pop(key, None)
+            env_key = self._resolve_key(key)
+            if env_key is not None:
+                value = self._env.get(env_key)
+        return value
+
+    def __contains__(self, key):
+        return key in self._env
+
+    def get(self, key, default=None):
+        return self._env.get(key, default)
+
+    def __iter__(self):
+        return iter(self._env)
+
+    def __len__(self):
+        return len(self._env)
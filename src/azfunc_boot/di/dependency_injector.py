@@ -1,18 +1,137 @@
-import asyncio
+import functools
 import inspect
-import typing
-from typing import Callable, Any, Dict, Type, List, Optional
+import threading
+import weakref
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Callable, Any, Dict, Iterable, Type, List, Optional, Tuple, Union
 
-from azfunc_boot.common.disposable import IDisposable
+from azfunc_boot.common.coroutines import is_async_callable
+from azfunc_boot.common.disposable import dispose_all, is_disposable
 from azfunc_boot.common.exceptions.not_found_error import NotFoundError
 from azfunc_boot.common.exceptions.validation_error import ValidationError
 from azfunc_boot.di.scope import ScopeManager
 
 
-class ServiceLifetime:
-    SINGLETON = "singleton"
-    TRANSIENT = "transient"
-    SCOPED = "scoped"
+# Sentinel to tell a missing singleton apart from one whose factory returned None
+_MISSING = object()
+
+
+# Constructor plans and generated builders, per class. Weak keys let classes that
+# are no longer used (e.g. defined inside a test) be collected. Values never
+# reference their own class, otherwise the entries would never be dropped
+_PLANS: "weakref.WeakKeyDictionary[Type, Tuple[Tuple[Type, bool], ...]]" = weakref.WeakKeyDictionary()
+_BUILDERS: "weakref.WeakKeyDictionary[Type, Callable[[Type, Callable[[Type], Any]], Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _parse_annotation(annotation: Any) -> Tuple[Type, bool]:
+    """
+    Parses a constructor annotation into (dependency_type, is_list).
+    """
+    # Detect if it is a generic type list[Something]. Reading __origin__ directly
+    # avoids the dispatch done by typing.get_origin over every generic alias kind
+    if getattr(annotation, "__origin__", None) is list:
+        # Example: list[BaseOcrStrategy]
+        return annotation.__args__[0], True
+    # If it's not a list, resolve normally
+    return annotation, False
+
+
+def _resolve_plan(cls: Type) -> Tuple[Tuple[Type, bool], ...]:
+    """
+    Parses the constructor of 'cls' into the dependency types to resolve, as
+    (dependency_type, is_list) pairs. Cached per class and shared by all
+    containers, so inspect.signature only runs once for each class.
+    """
+    plan = _PLANS.get(cls)
+    if plan is not None:
+        return plan
+
+    ctor = getattr(cls, "__init__")
+    sig = inspect.signature(ctor)
+    # Exclude 'self' from parameters
+    params = list(sig.parameters.values())[1:]
+
+    parsed = []
+    for p in params:
+        if p.annotation == inspect._empty:
+            raise ValidationError(
+                f"Parameter '{p.name}' in constructor of '{cls.__name__}' "
+                "does not have a type annotation to enable automatic injection."
+            )
+
+        parsed.append(_parse_annotation(p.annotation))
+
+    plan = _PLANS[cls] = tuple(parsed)
+    return plan
+
+
+def _as_list(dependency: Any) -> List[Any]:
+    # get_service(item_type) can return a single instance or a list
+    # Normalize to a list
+    return dependency if isinstance(dependency, list) else [dependency]
+
+
+def _compile_builder(cls: Type) -> Callable[[Type, Callable[[Type], Any]], Any]:
+    """
+    Generates a function creating 'cls' with one inline get_service call per
+    constructor parameter, so building an instance does not loop over its plan.
+    Cached per class, the code is only generated once. The class is passed to
+    the builder on each call, so the cached builder does not keep it alive.
+    """
+    builder = _BUILDERS.get(cls)
+    if builder is not None:
+        return builder
+
+    namespace = {"_as_list": _as_list}
+    args = []
+    for index, (dependency_type, is_list) in enumerate(_resolve_plan(cls)):
+        name = f"dependency_{index}"
+        namespace[name] = dependency_type
+        arg = f"get_service({name})"
+        args.append(f"_as_list({arg})" if is_list else arg)
+
+    source = f"def build(cls, get_service):\n    return cls({', '.join(args)})\n"
+    exec(source, namespace)
+    builder = _BUILDERS[cls] = namespace["build"]
+    return builder
+
+
+class ServiceLifetime(IntEnum):
+    SINGLETON = 0
+    TRANSIENT = 1
+    SCOPED = 2
+
+
+# String values accepted before ServiceLifetime became an IntEnum
+_LIFETIME_NAMES = {
+    "singleton": ServiceLifetime.SINGLETON,
+    "transient": ServiceLifetime.TRANSIENT,
+    "scoped": ServiceLifetime.SCOPED,
+}
+
+
+def _normalize_lifetime(lifetime: Union[int, str]) -> ServiceLifetime:
+    """
+    Converts a lifetime given as a ServiceLifetime, its int value or its
+    string name into a ServiceLifetime.
+
+    Raises:
+        ValidationError: If the lifetime is not known.
+    """
+    if isinstance(lifetime, str):
+        normalized = _LIFETIME_NAMES.get(lifetime.lower())
+        if normalized is not None:
+            return normalized
+    # bool is an int subclass, but True/False are not lifetimes
+    elif isinstance(lifetime, int) and not isinstance(lifetime, bool):
+        try:
+            return ServiceLifetime(lifetime)
+        except ValueError:
+            pass
+    raise ValidationError(f"Unknown lifetime type: {lifetime}")
 
 
 class ServiceRegistration:
@@ -20,16 +139,41 @@ class ServiceRegistration:
     Structure to store information for each registered service.
     """
 
-    def __init__(self, factory: Callable[[], Any], lifetime: str):
+    __slots__ = ("factory", "lifetime", "resolve")
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        lifetime: int,
+        resolve: Callable[[Optional[Dict[Type, Any]]], Any],
+    ):
         self.factory = factory
         self.lifetime = lifetime
+        # Precompiled resolution closure, built once at registration time
+        self.resolve = resolve
 
 
 class DependencyContainer:
     def __init__(self):
-        self._services: Dict[Type, List[ServiceRegistration]] = {}
+        # _services holds a single registration per type, promoted to a list
+        # only when the same type is registered more than once
+        self._services: Dict[
+            Type, Union[ServiceRegistration, List[ServiceRegistration]]
+        ] = {}
         # _singletons stores instances of services in SINGLETON mode
         self._singletons: Dict[Type, Any] = {}
+        # _singleton_locks guards the first creation of each singleton type
+        self._singleton_locks: Dict[Type, threading.RLock] = {}
+        # _disposables tracks IDisposable singletons, in creation order
+        self._disposables: List[Any] = []
+        # _auto_injected lists the types registered without a factory, whose
+        # constructors are resolved by reflection
+        self._auto_injected: List[Type] = []
+        # _resolvers caches, per service type, a single callable resolving all of
+        # its registrations. Built lazily and invalidated on new registrations
+        self._resolvers: Dict[Type, Callable[[Optional[Dict[Type, Any]]], Any]] = {}
+        # Once frozen, no more registrations are accepted
+        self._frozen = False
 
     def add_singleton(
         self,
@@ -43,7 +187,7 @@ class DependencyContainer:
         """
         self.add_service(
             service_type,
-            implementation_factory or (lambda: self._create_instance(service_type)),
+            implementation_factory or self._default_factory(service_type),
             lifetime=ServiceLifetime.SINGLETON,
         )
 
@@ -57,7 +201,7 @@ class DependencyContainer:
         """
         self.add_service(
             service_type,
-            implementation_factory or (lambda: self._create_instance(service_type)),
+            implementation_factory or self._default_factory(service_type),
             lifetime=ServiceLifetime.TRANSIENT,
         )
 
@@ -71,10 +215,18 @@ class DependencyContainer:
         """
         self.add_service(
             service_type,
-            implementation_factory or (lambda: self._create_instance(service_type)),
+            implementation_factory or self._default_factory(service_type),
             lifetime=ServiceLifetime.SCOPED,
         )
 
+    def _default_factory(self, service_type: Type) -> Callable[[], Any]:
+        """
+        Builds the factory used when no implementation_factory is given,
+        which creates the instance by injecting its constructor dependencies.
+        """
+        self._auto_injected.append(service_type)
+        return functools.partial(self._create_instance, service_type)
+
     # ----------------------------------------------------------------------
     # Main generic method to register services
     # ----------------------------------------------------------------------
@@ -82,19 +234,135 @@ class DependencyContainer:
         self,
         service_type: Type,
         implementation_factory: Callable[[], Any],
-        lifetime: str = ServiceLifetime.SINGLETON,
+        lifetime: Union[int, str] = ServiceLifetime.SINGLETON,
     ):
         """
         Registers a service in the container.
         Allows multiple registrations for the same "key" (service_type).
-        """
-        if service_type not in self._services:
-            self._services[service_type] = []
+        The lifetime may also be given by name ("singleton", "transient", "scoped").
 
-        self._services[service_type].append(
-            ServiceRegistration(factory=implementation_factory, lifetime=lifetime)
+        Raises:
+            ValidationError: If the lifetime is not known.
+        """
+        self._ensure_not_frozen()
+        lifetime = _normalize_lifetime(lifetime)
+        registration = ServiceRegistration(
+            factory=implementation_factory,
+            lifetime=lifetime,
+            resolve=self._build_resolver(service_type, implementation_factory, lifetime),
         )
 
+        self._resolvers.pop(service_type, None)
+        existing = self._services.get(service_type)
+        if existing is None:
+            self._services[service_type] = registration
+        elif isinstance(existing, list):
+            existing.append(registration)
+        else:
+            self._services[service_type] = [existing, registration]
+
+    def add_services_bulk(
+        self,
+        registrations: Iterable[Tuple[Type, Optional[Callable[[], Any]], int]],
+    ):
+        """
+        Registers several services at once, merging them into the container
+        with a single update per service type.
+
+        Args:
+            registrations: (service_type, implementation_factory, lifetime) tuples.
+                A None factory injects the constructor dependencies of service_type.
+        """
+        self._ensure_not_frozen()
+        # Lifetimes are validated before anything is registered
+        registrations = [
+            (service_type, implementation_factory, _normalize_lifetime(lifetime))
+            for service_type, implementation_factory, lifetime in registrations
+        ]
+        grouped: Dict[Type, List[ServiceRegistration]] = {}
+        for service_type, implementation_factory, lifetime in registrations:
+            factory = implementation_factory or self._default_factory(service_type)
+            grouped.setdefault(service_type, []).append(
+                ServiceRegistration(
+                    factory=factory,
+                    lifetime=lifetime,
+                    resolve=self._build_resolver(service_type, factory, lifetime),
+                )
+            )
+
+        for service_type, new_registrations in grouped.items():
+            self._resolvers.pop(service_type, None)
+            existing = self._services.get(service_type)
+            if existing is not None:
+                previous = existing if isinstance(existing, list) else [existing]
+                new_registrations = previous + new_registrations
+            self._services[service_type] = (
+                new_registrations[0]
+                if len(new_registrations) == 1
+                else new_registrations
+            )
+
+    def _ensure_not_frozen(self) -> None:
+        if self._frozen:
+            raise ValidationError(
+                "Cannot register services after the container has been frozen."
+            )
+
+    def freeze(self) -> None:
+        """
+        Marks the end of the setup phase. Registrations become read-only and the
+        resolver of every service type is built up front, so get_service is a
+        single table lookup.
+        """
+        if self._frozen:
+            return
+
+        for service_type in self._services:
+            if service_type not in self._resolvers:
+                self._resolvers[service_type] = self._build_type_resolver(service_type)
+
+        self._services = MappingProxyType(self._services)
+        self._frozen = True
+        self.get_service = self._get_service_frozen
+
+    def prewarm_singletons(self) -> None:
+        """
+        Creates every singleton up front. Types with a single singleton
+        registration then resolve through a constant getter, skipping the
+        existence check on each call.
+        """
+        for service_type, services in self._services.items():
+            if isinstance(services, list):
+                for registration in services:
+                    if registration.lifetime == ServiceLifetime.SINGLETON:
+                        registration.resolve(None)
+            elif services.lifetime == ServiceLifetime.SINGLETON:
+                instance = services.resolve(None)
+                self._resolvers[service_type] = self._constant_resolver(instance)
+
+    @staticmethod
+    def _constant_resolver(instance: Any) -> Callable[[Optional[Dict[Type, Any]]], Any]:
+        def resolve_prewarmed(scope: Optional[Dict[Type, Any]]) -> Any:
+            return instance
+
+        return resolve_prewarmed
+
+    def _get_service_frozen(
+        self, service_type: Type, scope: Optional[Dict[Type, Any]] = None
+    ) -> Any:
+        """
+        get_service implementation used once the container is frozen.
+        """
+        if scope is None:
+            scope = ScopeManager.get_current_scope()
+
+        resolve = self._resolvers.get(service_type)
+        if resolve is None:
+            raise NotFoundError(
+                f"Service has not been registered for {service_type.__name__}"
+            )
+        return resolve(scope)
+
     # ----------------------------------------------------------------------
     # Service resolution
     # ----------------------------------------------------------------------
@@ -111,57 +379,107 @@ class DependencyContainer:
         if scope is None:
             scope = ScopeManager.get_current_scope()
 
+        resolve = self._resolvers.get(service_type)
+        if resolve is None:
+            resolve = self._resolvers[service_type] = self._build_type_resolver(
+                service_type
+            )
+        return resolve(scope)
+
+    def _build_type_resolver(
+        self, service_type: Type
+    ) -> Callable[[Optional[Dict[Type, Any]]], Any]:
+        """
+        Builds the callable resolving every registration of 'service_type':
+        the instance itself for a single registration, or a list of instances.
+        """
         services = self._services.get(service_type)
-        if not services or len(services) == 0:
+        if services is None:
             raise NotFoundError(
                 f"Service has not been registered for {service_type.__name__}"
             )
 
-        # If there is only one registered service, return the instance
-        if len(services) == 1:
-            return self._resolve_service(services[0], service_type, scope)
+        # If there is only one registered service, resolve the instance
+        if not isinstance(services, list):
+            return services.resolve
+
+        # If there are multiple registered services, resolve a list of instances
+        resolvers = tuple(reg.resolve for reg in services)
+
+        def resolve_all(scope: Optional[Dict[Type, Any]]) -> List[Any]:
+            return [resolve(scope) for resolve in resolvers]
 
-        # If there are multiple registered services, return a list of instances
-        return [self._resolve_service(reg, service_type, scope) for reg in services]
+        return resolve_all
 
-    def _resolve_service(
+    def _build_resolver(
         self,
-        registration: ServiceRegistration,
         service_type: Type,
-        scope: Optional[Dict[Type, Any]],
-    ) -> Any:
+        factory: Callable[[], Any],
+        lifetime: int,
+    ) -> Callable[[Optional[Dict[Type, Any]]], Any]:
         """
-        Resolves a service instance according to its lifetime.
+        Compiles the resolution logic for a registration into a closure,
+        so resolving a service does not need to dispatch on its lifetime.
         """
-        lifetime = registration.lifetime
-        factory = registration.factory
+        # Lifetimes are normalized when registered, so a builder always exists
+        return self._RESOLVER_BUILDERS[lifetime](self, service_type, factory)
+
+    def _singleton_resolver(
+        self, service_type: Type, factory: Callable[[], Any]
+    ) -> Callable[[Optional[Dict[Type, Any]]], Any]:
+        singletons = self._singletons
+        disposables = self._disposables
+        lock = self._singleton_locks.setdefault(service_type, threading.RLock())
+
+        def resolve_singleton(scope: Optional[Dict[Type, Any]]) -> Any:
+            # Singleton: reuse the same instance (lock-free fast path)
+            instance = singletons.get(service_type, _MISSING)
+            if instance is not _MISSING:
+                return instance
+            with lock:
+                # Double-checked: another thread may have created it meanwhile
+                instance = singletons.get(service_type, _MISSING)
+                if instance is _MISSING:
+                    instance = singletons[service_type] = factory()
+                    if is_disposable(instance):
+                        disposables.append(instance)
+            return instance
 
-        if lifetime == ServiceLifetime.SINGLETON:
-            # Singleton: reuse the same instance
-            if service_type not in self._singletons:
-                self._singletons[service_type] = factory()
-            return self._singletons[service_type]
+        return resolve_singleton
 
-        elif lifetime == ServiceLifetime.TRANSIENT:
+    def _transient_resolver(
+        self, service_type: Type, factory: Callable[[], Any]
+    ) -> Callable[[Optional[Dict[Type, Any]]], Any]:
+        def resolve_transient(scope: Optional[Dict[Type, Any]]) -> Any:
             # Transient: create a new instance each time it is requested
             return factory()
 
-        elif lifetime == ServiceLifetime.SCOPED:
+        return resolve_transient
+
+    def _scoped_resolver(
+        self, service_type: Type, factory: Callable[[], Any]
+    ) -> Callable[[Optional[Dict[Type, Any]]], Any]:
+        def resolve_scoped(scope: Optional[Dict[Type, Any]]) -> Any:
             # Scoped: one instance per "scope" (e.g., per request)
-            # If scope is None, attempt to get it from the context
-            if scope is None:
-                scope = ScopeManager.get_current_scope()
             if scope is None:
                 raise ValidationError(
                     "Scoped services require an explicit scope. "
                     "Make sure the controller method is being executed within a scope."
                 )
-            if service_type not in scope:
-                scope[service_type] = factory()
-            return scope[service_type]
+            instance = scope.get(service_type, _MISSING)
+            if instance is _MISSING:
+                # Scope objects record disposable instances as they are stored
+                instance = scope[service_type] = factory()
+            return instance
 
-        else:
-            raise ValidationError(f"Unknown lifetime type: {lifetime}")
+        return resolve_scoped
+
+    # Lifetime -> resolver builder lookup table
+    _RESOLVER_BUILDERS = {
+        ServiceLifetime.SINGLETON: _singleton_resolver,
+        ServiceLifetime.TRANSIENT: _transient_resolver,
+        ServiceLifetime.SCOPED: _scoped_resolver,
+    }
 
     def _create_instance(self, cls: Type) -> Any:
         """
@@ -171,37 +489,21 @@ class DependencyContainer:
         This method is completely optional.
         If you prefer to use lambda factories, it is not necessary.
         """
-        ctor = getattr(cls, "__init__")
-        sig = inspect.signature(ctor)
-        # Exclude 'self' from parameters
-        params = list(sig.parameters.values())[1:]
-
-        args = []
-        for p in params:
-            if p.annotation == inspect._empty:
-                raise ValidationError(
-                    f"Parameter '{p.name}' in constructor of '{cls.__name__}' "
-                    "does not have a type annotation to enable automatic injection."
-                )
-
-            # Detect if it is a generic type list[Something]
-            origin = typing.get_origin(p.annotation)
-            if origin == list:
-                # Example: list[BaseOcrStrategy]
-                item_type = typing.get_args(p.annotation)[0]
-                dependency = self.get_service(item_type)
-                # get_service(item_type) can return a single instance or a list
-                # Normalize to a list
-                if not isinstance(dependency, list):
-                    dependency = [dependency]
-                args.append(dependency)
-            else:
-                # If it's not a list, resolve normally
-                dependency = self.get_service(p.annotation)
-                args.append(dependency)
-
         # Create the class instance with resolved arguments
-        return cls(*args)
+        return _compile_builder(cls)(cls, self.get_service)
+
+    def precompile(self) -> None:
+        """
+        Parses the constructors of all auto-injected services and generates their
+        builders up front, so that no reflection runs on the request path. Services
+        whose constructor cannot be injected are skipped and keep raising when they
+        are resolved.
+        """
+        for service_type in self._auto_injected:
+            try:
+                _compile_builder(service_type)
+            except ValidationError:
+                continue
 
     # ----------------------------------------------------------------------
     # Shutdown: Dispose of singletons that implement it
@@ -209,11 +511,15 @@ class DependencyContainer:
     async def shutdown(self):
         """
         Calls dispose() on all singletons that implement IDisposable.
+        Sync disposes run first and async disposes then run concurrently; every
+        dispose runs, and the first error is re-raised once all finish.
         """
-        for instance in self._singletons.values():
-            if isinstance(instance, IDisposable):
-                if hasattr(instance, "dispose") and callable(instance.dispose):
-                    if asyncio.iscoroutinefunction(instance.dispose):
-                        await instance.dispose()
-                    else:
-                        instance.dispose()
+        sync_disposables = []
+        async_disposables = []
+        for instance in self._disposables:
+            if is_async_callable(instance.dispose):
+                async_disposables.append(instance)
+            else:
+                sync_disposables.append(instance)
+
+        await dispose_all(sync_disposables, async_disposables)
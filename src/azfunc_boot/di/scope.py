@@ -1,7 +1,42 @@
-import asyncio
-from contextvars import ContextVar
-from typing import Any, Dict, Type, Optional
-from azfunc_boot.common.disposable import IDisposable
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Type, Optional, Tuple
+from azfunc_boot.common.coroutines import is_async_callable
+from azfunc_boot.common.disposable import dispose_all, is_disposable
+
+
+class Scope(dict):
+    """
+    Scope dictionary that also records the IDisposable instances stored in it,
+    in insertion order, so teardown does not have to inspect every instance.
+    Every insertion is recorded, whether made by the container or by handler code.
+    """
+
+    __slots__ = ("sync_disposables", "async_disposables")
+
+    def __init__(self):
+        super().__init__()
+        # Disposable instances, split by whether their dispose() is async
+        self.sync_disposables: List[Any] = []
+        self.async_disposables: List[Any] = []
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        previous = self.get(key, _MISSING)
+        super().__setitem__(key, value)
+        if value is not previous and is_disposable(value):
+            ScopeManager.track_disposable(self, value)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for key, value in dict(*args, **kwargs).items():
+            self[key] = value
+
+
+# Sentinel to tell a missing key apart from one mapped to None
+_MISSING = object()
 
 
 class ScopeManager:
@@ -25,15 +60,26 @@ class ScopeManager:
         Creates a new scope for scoped services.
         Similar to IServiceScopeFactory.CreateScope() in .NET.
         """
-        return {}
+        return Scope()
 
     @staticmethod
-    def set_current_scope(scope: Dict[Type, Any]) -> None:
+    def set_current_scope(scope: Dict[Type, Any]) -> Token:
         """
         Sets the current scope in the context.
         Similar to setting the scope in AsyncLocal in .NET.
+
+        Returns:
+            Token that restores the previous scope when passed to reset_current_scope.
         """
-        ScopeManager._current_scope.set(scope)
+        return ScopeManager._current_scope.set(scope)
+
+    @staticmethod
+    def reset_current_scope(token: Token) -> None:
+        """
+        Restores the scope that was current before the set_current_scope call
+        that returned the token.
+        """
+        ScopeManager._current_scope.reset(token)
 
     @staticmethod
     def get_current_scope() -> Optional[Dict[Type, Any]]:
@@ -49,6 +95,39 @@ class ScopeManager:
         """
         ScopeManager._current_scope.set(None)
 
+    @staticmethod
+    def track_disposable(scope: Dict[Type, Any], instance: Any) -> None:
+        """
+        Records an IDisposable instance created in the scope, in the bucket that
+        matches its dispose() kind.
+        Plain dict scopes are not tracked; they are inspected when disposed instead.
+        """
+        if isinstance(scope, Scope):
+            if is_async_callable(instance.dispose):
+                scope.async_disposables.append(instance)
+            else:
+                scope.sync_disposables.append(instance)
+
+    @staticmethod
+    def _split_disposables(scope: Dict[Type, Any]) -> Tuple[List[Any], List[Any]]:
+        """
+        Returns the (sync, async) disposable instances of a scope. Scope objects
+        already hold them; plain dicts are inspected value by value.
+        """
+        if isinstance(scope, Scope):
+            return scope.sync_disposables, scope.async_disposables
+
+        sync_disposables = []
+        async_disposables = []
+        for instance in scope.values():
+            if not is_disposable(instance):
+                continue
+            if is_async_callable(instance.dispose):
+                async_disposables.append(instance)
+            else:
+                sync_disposables.append(instance)
+        return sync_disposables, async_disposables
+
     @staticmethod
     async def _dispose_instance(instance: Any) -> None:
         """
@@ -56,7 +135,7 @@ class ScopeManager:
         Handles both async and sync dispose methods.
         """
         if hasattr(instance, "dispose") and callable(instance.dispose):
-            if asyncio.iscoroutinefunction(instance.dispose):
+            if is_async_callable(instance.dispose):
                 await instance.dispose()
             else:
                 instance.dispose()
@@ -65,7 +144,9 @@ class ScopeManager:
     async def dispose_scope(scope: Dict[Type, Any]) -> None:
         """
         Calls dispose() on all scoped services that implement IDisposable.
+        Sync disposes run first and async disposes then run concurrently; every
+        dispose runs, and the first error is re-raised once all finish.
         """
-        for instance in scope.values():
-            if isinstance(instance, IDisposable):
-                await ScopeManager._dispose_instance(instance)
+        sync_disposables, async_disposables = ScopeManager._split_disposables(scope)
+        if sync_disposables or async_disposables:
+            await dispose_all(sync_disposables, async_disposables)
@@ -4,14 +4,34 @@ import json
 import logging
 from abc import ABC, abstractmethod
 from typing import Callable, Any, Dict
-from azfunc_boot.common.disposable import IDisposable
+from azfunc_boot.common.coroutines import is_async_callable
+from azfunc_boot.common.disposable import dispose_sync
 from azfunc_boot.di.dependency_injector import DependencyContainer
 from azfunc_boot.di.scope import ScopeManager
 from azfunc_boot.mvc.scoped_blueprint import ScopedBlueprint
 from azure.functions import Blueprint, HttpResponse
 
+# Shared encoder so each response skips the per-call setup done by json.dumps
+_json_encode = json.JSONEncoder().encode
+
+
+@functools.lru_cache(maxsize=256)
+def _error_body(error_message: str) -> str:
+    """
+    Serializes the body of an error response; error messages tend to repeat.
+    """
+    return _json_encode({"error": error_message})
+
 
 class BaseController(ABC):
+    # Incremented whenever a subclass is defined, so cached discovery results
+    # can tell that the controller hierarchy changed
+    _subclass_generation: int = 0
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        BaseController._subclass_generation += 1
+
     def __init__(self, container: DependencyContainer, bp: Blueprint) -> None:
         """
         Initializes the base controller with the dependency container and blueprint.
@@ -21,6 +41,8 @@ class BaseController(ABC):
             bp: Azure Functions Blueprint.
         """
         self.container: DependencyContainer = container
+        # Scope wrappers already built, keyed by the wrapped method
+        self._wrapped_methods: Dict[Callable[..., Any], Callable[..., Any]] = {}
         # Wraps the blueprint with ScopedBlueprint to intercept calls
         # to any trigger (route, timer_trigger, blob_trigger, etc.)
         # and automatically apply scope
@@ -39,7 +61,7 @@ class BaseController(ABC):
             HttpResponse with JSON and correct mimetype
         """
         return HttpResponse(
-            json.dumps(data),
+            _json_encode(data),
             status_code=status_code,
             mimetype="application/json",
         )
@@ -57,7 +79,13 @@ class BaseController(ABC):
         Returns:
             HttpResponse with error in JSON
         """
-        return self._json_response({"error": error_message}, status_code)
+        if not isinstance(error_message, str):
+            return self._json_response({"error": error_message}, status_code)
+        return HttpResponse(
+            _error_body(error_message),
+            status_code=status_code,
+            mimetype="application/json",
+        )
 
     @abstractmethod
     def register_routes(self) -> None:
@@ -79,11 +107,18 @@ class BaseController(ABC):
         Returns:
             Method wrapped with automatic scope handling (async or sync as appropriate).
         """
+        # Re-registering the same method reuses its wrapper
+        wrapper = self._wrapped_methods.get(method)
+        if wrapper is not None:
+            return wrapper
+
         # Detects if the method is async or sync
-        if asyncio.iscoroutinefunction(method):
-            return self._create_async_wrapper(method)
+        if is_async_callable(method):
+            wrapper = self._create_async_wrapper(method)
         else:
-            return self._create_sync_wrapper(method)
+            wrapper = self._create_sync_wrapper(method)
+        self._wrapped_methods[method] = wrapper
+        return wrapper
 
     def _create_async_wrapper(self, method: Callable[..., Any]) -> Callable[..., Any]:
         """
@@ -96,16 +131,24 @@ class BaseController(ABC):
             Async function wrapped with scope handling.
         """
 
+        # Bound once here so each call reads closure cells instead of
+        # looking up globals and attributes
+        create_scope = ScopeManager.create_scope
+        dispose_scope = ScopeManager.dispose_scope
+        set_scope = ScopeManager._current_scope.set
+        reset_scope = ScopeManager._current_scope.reset
+
         @functools.wraps(method)
         async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-            scope = ScopeManager.create_scope()
-            ScopeManager.set_current_scope(scope)
+            scope = create_scope()
+            token = set_scope(scope)
             try:
-                result = await method(*args, **kwargs)
-                return result
+                return await method(*args, **kwargs)
             finally:
-                await ScopeManager.dispose_scope(scope)
-                ScopeManager.clear_current_scope()
+                try:
+                    await dispose_scope(scope)
+                finally:
+                    reset_scope(token)
 
         return async_wrapper
 
@@ -120,23 +163,38 @@ class BaseController(ABC):
             Sync function wrapped with scope handling.
         """
 
+        # Bound once here so each call reads closure cells instead of
+        # looking up globals and attributes
+        create_scope = ScopeManager.create_scope
+        dispose_scope_sync = self._dispose_scope_sync
+        set_scope = ScopeManager._current_scope.set
+        reset_scope = ScopeManager._current_scope.reset
+
+        # The coroutine diagnostic only runs until the method first returns
+        check_result = True
+
         @functools.wraps(method)
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
-            scope = ScopeManager.create_scope()
-            ScopeManager.set_current_scope(scope)
+            nonlocal check_result
+            scope = create_scope()
+            token = set_scope(scope)
             try:
                 result = method(*args, **kwargs)
-                # If the result is a coroutine, the developer should use async methods
-                if asyncio.iscoroutine(result):
-                    logging.warning(
-                        f"Method {method.__name__} is sync but returns a coroutine. "
-                        "Consider making the method async for better scope handling."
-                    )
+                if check_result:
+                    check_result = False
+                    # If the result is a coroutine, the developer should use async methods
+                    if asyncio.iscoroutine(result):
+                        logging.warning(
+                            f"Method {method.__name__} is sync but returns a coroutine. "
+                            "Consider making the method async for better scope handling."
+                        )
                 return result
             finally:
                 # For sync methods, we do sync dispose
-                self._dispose_scope_sync(scope)
-                ScopeManager.clear_current_scope()
+                try:
+                    dispose_scope_sync(scope)
+                finally:
+                    reset_scope(token)
 
         return sync_wrapper
 
@@ -149,16 +207,19 @@ class BaseController(ABC):
         Args:
             scope: Dictionary containing instances of scoped services.
         """
-        for instance in scope.values():
-            if isinstance(instance, IDisposable):
-                if hasattr(instance, "dispose") and callable(instance.dispose):
-                    # For sync methods, we only call sync dispose
-                    if not asyncio.iscoroutinefunction(instance.dispose):
-                        instance.dispose()
-                    else:
-                        # If it's async, we cannot call it from a sync context
-                        logging.warning(
-                            f"Service {type(instance).__name__} has an async dispose() "
-                            "but it is being called from a sync context. "
-                            "Consider using async methods in controllers."
-                        )
+        sync_disposables, async_disposables = ScopeManager._split_disposables(scope)
+        error = dispose_sync(sync_disposables)
+        # Async disposes cannot be awaited from a sync context
+        for instance in async_disposables:
+            BaseController._warn_async_dispose(instance)
+        if error is not None:
+            raise error
+
+    @staticmethod
+    def _warn_async_dispose(instance: Any) -> None:
+        # If it's async, we cannot call it from a sync context
+        logging.warning(
+            f"Service {type(instance).__name__} has an async dispose() "
+            "but it is being called from a sync context. "
+            "Consider using async methods in controllers."
+        )
@@ -2,49 +2,182 @@ import logging
 import inspect
 import pkgutil
 import importlib
-from typing import List, Type
+import sys
+import threading
+from types import ModuleType
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Optional, Pattern, Set, Tuple, Type
 from azfunc_boot.di.dependency_injector import DependencyContainer
 from azfunc_boot.mvc.base_controller import BaseController
-from azure.functions import Blueprint
+
+if TYPE_CHECKING:
+    from azure.functions import Blueprint
+
+# Messages use %-style arguments, so they are only formatted when the level is enabled
+logger = logging.getLogger(__name__)
+
+# Controller classes discovered per package and module pattern, shared by every
+# ControllerDiscovery in the process so the package tree is only walked once. Each
+# entry records the BaseController subclass generation it was computed at, and is
+# discarded once new controller classes are defined
+_DISCOVERY_CACHE: Dict[Tuple[str, Optional[Pattern[str]]], Tuple[int, List[Type]]] = {}
+_DISCOVERY_LOCK = threading.Lock()
 
 
 class ControllerDiscovery:
     def __init__(
-        self, container: DependencyContainer, blueprint: Blueprint, package: str
+        self,
+        container: DependencyContainer,
+        blueprint: "Blueprint",
+        package: str,
+        controller_classes: Optional[List[Type]] = None,
+        module_pattern: Optional[Pattern[str]] = None,
     ):
         self.container = container
         self.blueprint = blueprint
+        # When set, only modules whose full name matches it are imported
+        self.module_pattern = module_pattern
         self.controllers_instances: List = []
         self.registered_controllers: List[Type] = []
-        self._discover(package)
+        # Set mirror of registered_controllers for O(1) duplicate checks
+        self._registered_set: Set[Type] = set()
+        if controller_classes is None:
+            self._discover(package)
+        else:
+            # Controllers already known (e.g. from a discovery manifest)
+            for controller_cls in controller_classes:
+                if controller_cls not in self._registered_set:
+                    self._registered_set.add(controller_cls)
+                    self.registered_controllers.append(controller_cls)
         self._register_all_controllers()
 
     @staticmethod
     def create(
-        container: DependencyContainer, blueprint: Blueprint, package: str
+        container: DependencyContainer,
+        blueprint: "Blueprint",
+        package: str,
+        controller_classes: Optional[List[Type]] = None,
+        module_pattern: Optional[Pattern[str]] = None,
     ) -> "ControllerDiscovery":
         """
         Static method to instantiate the ControllerDiscovery class.
         """
         return ControllerDiscovery(
-            container=container, blueprint=blueprint, package=package
+            container=container,
+            blueprint=blueprint,
+            package=package,
+            controller_classes=controller_classes,
+            module_pattern=module_pattern,
         )
 
+    @staticmethod
+    def reset_cache() -> None:
+        """
+        Forgets the discovered controllers, so the next discovery walks the packages again.
+        """
+        with _DISCOVERY_LOCK:
+            _DISCOVERY_CACHE.clear()
+
     def _discover(self, package: str):
         """
         Automatically discovers classes that inherit from BaseController in the specified package
         and registers them dynamically.
         """
+        cache_key = (package, self.module_pattern)
+        with _DISCOVERY_LOCK:
+            cached = _DISCOVERY_CACHE.get(cache_key)
+        if cached is None or cached[0] != BaseController._subclass_generation:
+            # The walk imports user modules, which may start a discovery themselves,
+            # so it runs outside the lock. Concurrent walks store the same result
+            self._walk_package(package)
+            generation = BaseController._subclass_generation
+            with _DISCOVERY_LOCK:
+                _DISCOVERY_CACHE[cache_key] = (generation, list(self.registered_controllers))
+            return
+
+        for controller_cls in cached[1]:
+            self._register_controller_class(controller_cls)
+
+    def _walk_package(self, package: str):
+        """
+        Imports every module of the package and registers the controllers defined in it.
+        """
         package_path, package_prefix = self._get_package_info(package)
-        
-        for _, module_name, is_pkg in pkgutil.walk_packages(package_path, package_prefix):
-            full_module_name = self._build_full_module_name(
-                module_name, package, package_prefix
-            )
+
+        module_names = self._collect_module_names(package, package_path, package_prefix)
+
+        if self.module_pattern is not None:
+            module_names = [
+                name for name in module_names if self.module_pattern.search(name)
+            ]
+
+        # Importing the modules is enough: Python tracks the subclasses of BaseController
+        modules = self._import_modules(module_names)
+
+        self._discover_controller_subclasses(package)
+        # Controllers defined outside the package but imported by its modules
+        for module in modules:
+            self._discover_controllers_in_module(module)
+
+    def _collect_module_names(
+        self, package: str, package_path: List[str], package_prefix: str
+    ) -> List[str]:
+        """
+        Lists the modules of the package breadth-first with pkgutil.iter_modules.
+        Unlike pkgutil.walk_packages, only the subpackages accepted by
+        _should_descend are imported to list their modules.
+
+        Returns:
+            list: Full names of the modules and subpackages found
+        """
+        module_names = []
+        pending = deque([(package_path, package_prefix)])
+        while pending:
+            path, prefix = pending.popleft()
+            for _, module_name, is_pkg in pkgutil.iter_modules(path, prefix):
+                full_module_name = self._build_full_module_name(module_name, package, prefix)
+                module_names.append(full_module_name)
+                if not is_pkg or not self._should_descend(full_module_name):
+                    continue
+
+                subpackage = self._import_module_safely(full_module_name)
+                subpackage_path = getattr(subpackage, "__path__", None)
+                if subpackage_path is not None:
+                    pending.append((subpackage_path, full_module_name + "."))
+
+        return module_names
+
+    def _should_descend(self, subpackage_name: str) -> bool:
+        """
+        Decides whether the modules of a subpackage are discovered. Subclasses can
+        override it to skip subpackages that hold no controllers.
+
+        Args:
+            subpackage_name: Full name of the subpackage
+
+        Returns:
+            bool: True to discover the subpackage modules (default)
+        """
+        return True
+
+    def _import_modules(self, module_names: List[str]) -> List[ModuleType]:
+        """
+        Imports the given modules one by one, in discovery order. Controllers are
+        registered in definition order, so the imports must stay sequential.
+
+        Args:
+            module_names: Full names of the modules to import
+
+        Returns:
+            list: The modules that could be imported
+        """
+        modules = []
+        for full_module_name in module_names:
+            # Failures are logged by _import_module_safely
             module = self._import_module_safely(full_module_name)
-            
-            if module:
-                self._discover_controllers_in_module(module)
+            if module is not None:
+                modules.append(module)
+        return modules
 
     def _get_package_info(self, package: str) -> tuple[list[str], str]:
         """
@@ -55,11 +188,11 @@ class ControllerDiscovery:
             tuple: (package_path, package_prefix)
         """
         try:
-            package_module = importlib.import_module(package)
+            package_module = sys.modules.get(package) or importlib.import_module(package)
             package_path = package_module.__path__
             package_prefix = package_module.__name__ + '.'
         except ImportError as e:
-            logging.error(f"Could not import package {package}: {e}")
+            logger.error("Could not import package %s: %s", package, e)
             # Fallback: try to use the string as a directory path
             package_path = [package]
             package_prefix = ''
@@ -73,7 +206,7 @@ class ControllerDiscovery:
         Builds the full module name based on whether package_prefix is available.
         
         Args:
-            module_name: The module name from pkgutil.walk_packages
+            module_name: The module name from pkgutil.iter_modules
             package: The original package name
             package_prefix: The package prefix (empty if package import failed)
         
@@ -96,26 +229,63 @@ class ControllerDiscovery:
         Returns:
             Module object if import succeeds, None otherwise
         """
+        # Modules that are already loaded skip the import machinery and its lock
+        module = sys.modules.get(full_module_name)
+        if module is not None:
+            return module
         try:
             return importlib.import_module(full_module_name)
         except ImportError as e:
-            logging.error(f"Could not import module {full_module_name}: {e}")
+            logger.error("Could not import module %s: %s", full_module_name, e)
             return None
 
+    def _discover_controller_subclasses(self, package: str):
+        """
+        Walks the subclasses of BaseController and registers the concrete ones
+        defined in the given package or its subpackages, in modules matching the
+        module pattern when one is set.
+
+        Args:
+            package: Name of the package whose controllers are registered
+        """
+        package_prefix = package + "."
+        module_pattern = self.module_pattern
+        # Depth-first walk that preserves definition order. Classes reachable through
+        # several bases (multiple inheritance) are only visited once
+        seen: Set[Type] = set()
+        pending = list(reversed(BaseController.__subclasses__()))
+        while pending:
+            cls = pending.pop()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            pending.extend(reversed(cls.__subclasses__()))
+
+            module = cls.__module__
+            if not (module == package or module.startswith(package_prefix)):
+                continue
+            # Modules skipped by the pattern may still have been imported elsewhere
+            if module_pattern is not None and not module_pattern.search(module):
+                continue
+            if self._is_controller_class(cls):
+                self._register_controller_class(cls)
+
     def _discover_controllers_in_module(self, module):
         """
-        Discovers and registers controller classes in a given module.
-        
+        Registers the controller classes bound in a module, wherever they are defined.
+        Classes already registered are skipped.
+
         Args:
             module: The module object to inspect for controllers
         """
-        for name, obj in inspect.getmembers(module, inspect.isclass):
-            if self._is_controller_class(obj):
-                self._register_controller_class(obj)
+        for value in list(vars(module).values()):
+            if isinstance(value, type) and self._is_controller_class(value):
+                self._register_controller_class(value)
 
     def _is_controller_class(self, obj) -> bool:
         """
-        Checks if an object is a controller class (subclass of BaseController but not BaseController itself).
+        Checks if an object is a concrete controller class (non-abstract subclass of
+        BaseController but not BaseController itself).
         
         Args:
             obj: The object to check
@@ -123,7 +293,11 @@ class ControllerDiscovery:
         Returns:
             bool: True if obj is a controller class, False otherwise
         """
-        return issubclass(obj, BaseController) and obj is not BaseController
+        return (
+            issubclass(obj, BaseController)
+            and obj is not BaseController
+            and not inspect.isabstract(obj)
+        )
 
     def _register_controller_class(self, controller_cls: Type):
         """
@@ -132,9 +306,10 @@ class ControllerDiscovery:
         Args:
             controller_cls: The controller class to register
         """
-        if controller_cls not in self.registered_controllers:
+        if controller_cls not in self._registered_set:
+            self._registered_set.add(controller_cls)
             self.registered_controllers.append(controller_cls)
-            logging.info(f"Controller discovered and registered: {controller_cls.__name__}")
+            logger.debug("Controller discovered and registered: %s", controller_cls.__name__)
 
     def _register_all_controllers(self):
         """
@@ -143,6 +318,12 @@ class ControllerDiscovery:
         for controller_cls in self.registered_controllers:
             instance = controller_cls(container=self.container, bp=self.blueprint)
             self.controllers_instances.append(instance)
-            logging.info(
-                f"Controller {controller_cls.__name__} instantiated and registered."
+            logger.debug("Controller %s instantiated and registered.", controller_cls.__name__)
+
+        # A single summary line instead of one log record per controller
+        if self.registered_controllers:
+            logger.info(
+                "Registered %d controllers: %s",
+                len(self.registered_controllers),
+                ", ".join(cls.__name__ for cls in self.registered_controllers),
             )
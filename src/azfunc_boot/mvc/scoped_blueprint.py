@@ -1,10 +1,24 @@
-from typing import Callable, Any, Dict, TYPE_CHECKING
-from azure.functions import Blueprint
-from azfunc_boot.mvc.trigger_wrapper import TriggerWrapper
+from __future__ import annotations
+
+from typing import Callable, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from azure.functions import Blueprint
     from azfunc_boot.mvc.base_controller import BaseController
 
+# Blueprint methods that are NOT triggers and should not be wrapped
+_NON_TRIGGER_METHODS = frozenset(
+    {
+        "register_blueprint",
+        "register_functions",
+        "get_functions",
+        "validate_function_names",
+        "function_name",
+        "http_type",
+        "retry",
+    }
+)
+
 
 class ScopedBlueprint:
     """
@@ -15,27 +29,19 @@ class ScopedBlueprint:
     change their code.
     """
 
-    # Blueprint methods that are NOT triggers and should not be wrapped
-    _NON_TRIGGER_METHODS = {
-        "register_blueprint",
-        "register_functions",
-        "get_functions",
-        "validate_function_names",
-        "function_name",
-        "http_type",
-        "retry",
-    }
+    # The wrapped objects live in slots; __dict__ is kept for the cached trigger wrappers
+    __slots__ = ("_blueprint", "_controller", "__dict__")
 
-    def __init__(self, blueprint: Blueprint, controller: "BaseController") -> None:
+    def __init__(self, blueprint: Blueprint, controller: BaseController) -> None:
         self._blueprint: Blueprint = blueprint
-        self._controller: "BaseController" = controller
-        # Cache for already processed methods
-        self._cached_methods: Dict[str, Callable[..., Any]] = {}
+        self._controller: BaseController = controller
 
     def __getattr__(self, name: str) -> Any:
         """
         Intercepts access to any attribute/method of the blueprint.
         If it is a callable method that is a trigger, wraps it to automatically apply scope.
+        Only called for attributes not found on the instance, so trigger wrappers
+        stored in the instance dict are returned without reaching this method.
 
         Args:
             name: Name of the attribute/method to get.
@@ -43,28 +49,24 @@ class ScopedBlueprint:
         Returns:
             The wrapped attribute or method if it is a trigger, or the original attribute.
         """
-        # If we already have it in cache, return it
-        if name in self._cached_methods:
-            return self._cached_methods[name]
+        # Private names are never triggers, so they are forwarded right away
+        if name[:1] == "_":
+            return getattr(self._blueprint, name)
 
         # Get the attribute from the original blueprint
         attr: Any = getattr(self._blueprint, name)
 
         # Verify if it is a trigger that should be wrapped:
-        # 1. Must be callable
-        # 2. Must not start with "_" (private methods)
-        # 3. Must not be in the list of methods that are NOT triggers
-        is_trigger: bool = (
-            callable(attr)
-            and not name.startswith("_")
-            and name not in self._NON_TRIGGER_METHODS
-        )
+        # 1. Must not be in the list of methods that are NOT triggers
+        # 2. Must be callable
+        is_trigger: bool = name not in _NON_TRIGGER_METHODS and callable(attr)
 
         if is_trigger:
             # Create a wrapper that intercepts the trigger call
             trigger_wrapper: Callable[..., Any] = self._create_trigger_wrapper(attr)
-            # Cache the wrapped method
-            self._cached_methods[name] = trigger_wrapper
+            # Cache the wrapped method in the instance dict, bypassing __setattr__
+            # so it is not forwarded to the original blueprint
+            object.__setattr__(self, name, trigger_wrapper)
             return trigger_wrapper
 
         # If it's not a trigger, return it as is (attributes, non-trigger methods, etc.)
@@ -81,9 +83,19 @@ class ScopedBlueprint:
             original_trigger: Original trigger method from the Blueprint.
 
         Returns:
-            Wrapper function that returns a TriggerDecorator.
+            Wrapper function that returns a decorator wrapping the function with scope.
         """
-        return TriggerWrapper(self, original_trigger)
+        # Bound once per trigger rather than looked up on every decoration
+        wrap_with_scope = self._controller._wrap_with_scope
+
+        def trigger_wrapper(*args: Any, **kwargs: Any) -> Callable[..., Any]:
+            def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+                wrapped_method = wrap_with_scope(func)
+                return original_trigger(*args, **kwargs)(wrapped_method)
+
+            return decorator
+
+        return trigger_wrapper
 
     def __setattr__(self, name: str, value: Any) -> None:
         """
@@ -98,5 +110,7 @@ class ScopedBlueprint:
         if name.startswith("_"):
             super().__setattr__(name, value)
         else:
-            # Delegate to the original blueprint
+            # Delegate to the original blueprint, dropping any cached trigger wrapper
+            # that would otherwise shadow the new value
+            self.__dict__.pop(name, None)
             setattr(self._blueprint, name, value)
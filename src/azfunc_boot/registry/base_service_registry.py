@@ -1,22 +1,62 @@
 import inspect
 import logging
 from abc import ABC
-from typing import Callable
+from typing import Any, Callable, List, Tuple
+
+# Messages use %-style arguments, so they are only formatted when the level is enabled
+logger = logging.getLogger(__name__)
 
 def register_service(func: Callable):
     func._is_register_service = True
     return func
 
 
+def _find_register_services(cls: type) -> Tuple[str, ...]:
+    """
+    Lists the names of the methods marked with @register_service on a class and its
+    bases, sorted by name like inspect.getmembers returns them.
+    """
+    members = {}
+    for klass in reversed(cls.__mro__):
+        members.update(vars(klass))
+
+    names = []
+    for name, member in members.items():
+        # Only instance methods and classmethods bind to methods
+        if isinstance(member, staticmethod):
+            continue
+        func = getattr(member, "__func__", member)
+        if inspect.isfunction(func) and getattr(func, "_is_register_service", False):
+            names.append(name)
+    return tuple(sorted(names))
+
+
 class BaseServiceRegistry(ABC):
+    # Every subclass in definition order, recorded when the class is created so
+    # discovery only has to import the registry modules
+    _registry_classes: List[type] = []
+    # Names of the @register_service methods of the class, in name order
+    _register_service_names: Tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        BaseServiceRegistry._registry_classes.append(cls)
+        cls._register_service_names = _find_register_services(cls)
+
     def __init__(self):
+        # Registration stays eager: create_app freezes the container once setup
+        # ends, so every service must be registered by then. Services themselves
+        # are still built lazily, unless prewarm_singletons is called
         self.register_all_services()
 
     def register_all_services(self):
-        for _, method in inspect.getmembers(self, predicate=inspect.ismethod):
+        # The names are resolved once per class, so instances do not pay for
+        # inspect.getmembers evaluating every attribute (properties included)
+        for name in self._register_service_names:
+            method = getattr(self, name)
             if getattr(method, "_is_register_service", False):
                 try:
                     method()
-                    logging.info(f"Service registered successfully: {method.__name__}")
+                    logger.info("Service registered successfully: %s", method.__name__)
                 except Exception as e:
-                    logging.error(f"Error registering service '{method.__name__}': {e}")
+                    logger.error("Error registering service '%s': %s", method.__name__, e)
@@ -1,11 +1,75 @@
+import functools
 import importlib
-import inspect
+import importlib.util
 import logging
 import pkgutil
+import sys
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple, Type
 
 from azfunc_boot.di.dependency_injector import DependencyContainer
 from azfunc_boot.registry.base_service_registry import BaseServiceRegistry
 
+# Messages use %-style arguments, so they are only formatted when the level is enabled
+logger = logging.getLogger(__name__)
+
+
+def _cached_import(name: str, modules=sys.modules):
+    """
+    Returns an already loaded module straight from sys.modules, only going
+    through the import machinery (and its lock) on a miss.
+    """
+    module = modules.get(name)
+    if module is not None:
+        spec = getattr(module, "__spec__", None)
+        # Modules still being initialized by another thread go through the import
+        # machinery, which waits for them to finish
+        if spec is not None and not getattr(spec, "_initializing", False):
+            return module
+    return importlib.import_module(name)
+
+
+def _import_or_error(name: str) -> Any:
+    """
+    Imports a module, returning the exception raised by the import instead of
+    propagating it.
+    """
+    try:
+        return _cached_import(name)
+    except Exception as e:
+        return e
+
+
+@functools.lru_cache(maxsize=64)
+def _iter_modules_cached(package_path: Tuple[str, ...]) -> Tuple[Tuple[str, bool], ...]:
+    """
+    Lists the (module_name, is_pkg) entries of a package path, memoized so the
+    package directories are only scanned once per process.
+    """
+    return tuple(
+        (module_name, is_pkg)
+        for _, module_name, is_pkg in pkgutil.iter_modules(list(package_path))
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _registry_set(count: int) -> FrozenSet[Type]:
+    """
+    Returns the registry classes recorded by BaseServiceRegistry as a set. Keyed
+    by the number of recorded classes, which only grows, so the set is rebuilt
+    only after new registries are defined.
+    """
+    return frozenset(BaseServiceRegistry._registry_classes[:count])
+
+
+def _known_registries() -> FrozenSet[Type]:
+    return _registry_set(len(BaseServiceRegistry._registry_classes))
+
+
+# Registry classes discovered per registries package, so later discoveries of the
+# same package in the process only instantiate them. Keyed by the number of recorded
+# registry classes as well, so defining new registries invalidates the entries
+_DISCOVERY_CACHE: Dict[Tuple[str, int], Tuple[Type, ...]] = {}
+
 
 class RegistryManager:
     """
@@ -20,12 +84,22 @@ class RegistryManager:
             registries_package: Name of the package where to search for registries (e.g.: "registries").
         """
         self.container = container
-        self.registries_package = registries_package
+        # Interned names let repeated dict lookups (sys.modules, discovery cache)
+        # succeed on the identity check before comparing characters
+        self.registries_package = sys.intern(registries_package)
         self.registered_services = []
+        # Registry classes already instantiated, so a class imported by several
+        # modules is only registered once
+        self._registered_classes: Set[Type] = set()
+        # Set when a module fails to import or register, so the partial result
+        # of that discovery is not cached
+        self._had_errors = False
 
     @staticmethod
     def create_registry(
-        container: DependencyContainer, registries_package: str = "registries"
+        container: DependencyContainer,
+        registries_package: str = "registries",
+        registry_classes: Optional[List[Type]] = None,
     ) -> "RegistryManager":
         """
         Factory method to create and execute registry discovery.
@@ -33,12 +107,16 @@ class RegistryManager:
         Args:
             container: Dependency container.
             registries_package: Package where to search for registries (default: "registries").
+            registry_classes: Already known registry classes. When given, discovery is skipped.
 
         Returns:
             RegistryManager with all discovered and executed registries.
         """
         registry = RegistryManager(container, registries_package)
-        registry.register_services()
+        if registry_classes is None:
+            registry.register_services()
+        else:
+            registry._instantiate_registries(registry_classes)
         return registry
 
     def register_services(self):
@@ -46,11 +124,39 @@ class RegistryManager:
         Automatically discovers all classes that inherit from BaseServiceRegistry
         in the specified package and instantiates them to execute their registrations.
         """
+        cached = _DISCOVERY_CACHE.get(
+            (self.registries_package, len(BaseServiceRegistry._registry_classes))
+        )
+        if cached is not None:
+            self._instantiate_registries(cached)
+            return
+
         package_path = self._load_base_package()
         if package_path is None:
             return
 
         self._process_all_modules(package_path)
+        registry_classes = tuple(type(registry) for registry in self.registered_services)
+        if not self._had_errors:
+            cache_key = (self.registries_package, len(BaseServiceRegistry._registry_classes))
+            _DISCOVERY_CACHE[cache_key] = registry_classes
+
+        # A single summary line instead of one log record per registry
+        if registry_classes:
+            logger.info(
+                "Registered services from %d registries: %s",
+                len(registry_classes),
+                ", ".join(cls.__name__ for cls in registry_classes),
+            )
+
+    @staticmethod
+    def invalidate_cache() -> None:
+        """
+        Forgets the registry classes discovered so far, so the next discovery
+        scans the packages again.
+        """
+        _DISCOVERY_CACHE.clear()
+        _iter_modules_cached.cache_clear()
 
     def _load_base_package(self):
         """
@@ -59,22 +165,30 @@ class RegistryManager:
         Returns:
             Package path if valid, None otherwise.
         """
+        # find_spec reports a missing package by returning None, so the common
+        # "no registries package" case does not build and unwind an ImportError
         try:
-            base_package = importlib.import_module(self.registries_package)
-            package_path = getattr(base_package, "__path__", None)
+            spec = importlib.util.find_spec(self.registries_package)
+            if spec is None:
+                logger.warning(
+                    "Could not find package '%s'. Skipping registry discovery.",
+                    self.registries_package,
+                )
+                return None
 
-            if package_path is None:
-                logging.warning(
-                    f"Package '{self.registries_package}' is not a valid package. "
-                    "Skipping registry discovery."
+            if spec.submodule_search_locations is None:
+                logger.warning(
+                    "Package '%s' is not a valid package. Skipping registry discovery.",
+                    self.registries_package,
                 )
                 return None
 
-            return package_path
-        except ImportError as e:
-            logging.warning(
-                f"Could not import package '{self.registries_package}': {e}. "
-                "Skipping registry discovery."
+            return _cached_import(self.registries_package).__path__
+        except (ImportError, ValueError) as e:
+            logger.warning(
+                "Could not import package '%s': %s. Skipping registry discovery.",
+                self.registries_package,
+                e,
             )
             return None
 
@@ -85,40 +199,71 @@ class RegistryManager:
         Args:
             package_path: Package path where to search for modules.
         """
-        for _, module_name, is_pkg in pkgutil.iter_modules(package_path):
-            if not is_pkg:  # Only modules, not subpackages
-                self._process_module(module_name)
+        prefix = self.registries_package + "."
+        module_names = [
+            sys.intern(prefix + module_name)
+            for module_name, is_pkg in _iter_modules_cached(tuple(package_path))
+            if not is_pkg  # Only modules, not subpackages
+        ]
+
+        # Imported one by one: registry modules may import each other, and the
+        # registries are instantiated in module order
+        for full_module_name in module_names:
+            self._process_module(full_module_name)
 
-    def _process_module(self, module_name: str):
+    def _process_module(self, full_module_name: str):
         """
         Processes an individual module, importing it and registering its registry classes.
 
         Args:
-            module_name: Name of the module to process.
+            full_module_name: Full dotted name of the module to process.
         """
+        module = _import_or_error(full_module_name)
+        # Import failures come back as values and are logged without being re-raised
+        if isinstance(module, ImportError):
+            self._had_errors = True
+            logger.error("Could not import module '%s': %s", full_module_name, module)
+            return
+        if isinstance(module, Exception):
+            self._had_errors = True
+            logger.error("Error processing module '%s': %s", full_module_name, module)
+            return
+
         try:
-            full_module_name = f"{self.registries_package}.{module_name}"
-            module = importlib.import_module(full_module_name)
             self._register_registry_classes(module)
-        except ImportError as e:
-            logging.error(
-                f"Could not import module '{full_module_name}': {e}"
-            )
         except Exception as e:
-            logging.error(
-                f"Error processing module '{module_name}': {e}"
-            )
+            self._had_errors = True
+            logger.error("Error processing module '%s': %s", full_module_name, e)
 
     def _register_registry_classes(self, module):
         """
         Searches and registers all classes that inherit from BaseServiceRegistry in a module.
+        A module-level ``__registry_classes__`` tuple, when present, is used as is.
 
         Args:
             module: Module where to search for registry classes.
         """
-        for _, cls in inspect.getmembers(module, inspect.isclass):
-            if self._is_valid_registry_class(cls):
-                self._create_registry_instance(cls)
+        # Modules may list their registries explicitly, in registration order
+        declared = getattr(module, "__registry_classes__", None)
+        if declared is not None:
+            for cls in declared:
+                if isinstance(cls, type) and issubclass(cls, BaseServiceRegistry):
+                    self._create_registry_instance(cls)
+                else:
+                    logger.error(
+                        "Skipping '%r' in %s.__registry_classes__: not a BaseServiceRegistry subclass",
+                        cls,
+                        module.__name__,
+                    )
+            return
+
+        known = _known_registries()
+        # Registries record themselves when their class is created, so each module
+        # attribute is a set lookup. Classes re-exported from other packages are
+        # registered too, in the order the module binds them
+        for value in list(vars(module).values()):
+            if isinstance(value, type) and value in known:
+                self._create_registry_instance(value)
 
     def _is_valid_registry_class(self, cls) -> bool:
         """
@@ -130,10 +275,7 @@ class RegistryManager:
         Returns:
             True if the class is a valid registry, False otherwise.
         """
-        return (
-            issubclass(cls, BaseServiceRegistry)
-            and cls != BaseServiceRegistry
-        )
+        return cls in _known_registries()
 
     def _create_registry_instance(self, registry_class):
         """
@@ -142,6 +284,22 @@ class RegistryManager:
         Args:
             registry_class: Registry class to instantiate.
         """
+        if registry_class in self._registered_classes:
+            return
+        self._registered_classes.add(registry_class)
         instance = registry_class(self.container)
         self.registered_services.append(instance)
-        logging.info(f"Registered services from {registry_class.__name__}")
+
+    def _instantiate_registries(self, registry_classes):
+        """
+        Instantiates already known registry classes in a single pass, logging
+        one summary line instead of one line per class.
+
+        Args:
+            registry_classes: Registry classes to instantiate, in registration order.
+        """
+        container = self.container
+        self.registered_services = [cls(container) for cls in registry_classes]
+        logger.debug(
+            "Registered services from %d known registries", len(self.registered_services)
+        )
@@ -3,7 +3,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from azfunc_boot.bootstrap.app_factory import AppFactory, create_app, shutdown_container
+from azfunc_boot.bootstrap.app_factory import AppContext, AppFactory, create_app, shutdown_container
 from azfunc_boot.di.dependency_injector import DependencyContainer
 
 
@@ -35,12 +35,13 @@ class TestAppFactory:
 
     def test_create_app(self):
         with patch("azfunc_boot.bootstrap.app_factory.RegistryManager.create_registry"), patch(
-            "azfunc_boot.bootstrap.app_factory.ControllerDiscovery.create"
+            "azfunc_boot.mvc.controller_discovery.ControllerDiscovery.create"
         ), patch("azure.functions.FunctionApp.register_blueprint"):
             app, container = self.factory.create_app()
 
             assert app is not None
             assert isinstance(container, DependencyContainer)
+            assert container._frozen is True
 
     def test_create_app_with_pre_setup_hook(self):
         pre_hook = MagicMock()
@@ -48,7 +49,7 @@ class TestAppFactory:
         factory = AppFactory(pre_setup_hook=pre_hook)
 
         with patch("azfunc_boot.bootstrap.app_factory.RegistryManager.create_registry"), patch(
-            "azfunc_boot.bootstrap.app_factory.ControllerDiscovery.create"
+            "azfunc_boot.mvc.controller_discovery.ControllerDiscovery.create"
         ), patch("azure.functions.FunctionApp.register_blueprint"):
             _, container = factory.create_app()
 
@@ -60,12 +61,28 @@ class TestAppFactory:
         factory = AppFactory(post_setup_hook=post_hook)
 
         with patch("azfunc_boot.bootstrap.app_factory.RegistryManager.create_registry"), patch(
-            "azfunc_boot.bootstrap.app_factory.ControllerDiscovery.create"
+            "azfunc_boot.mvc.controller_discovery.ControllerDiscovery.create"
         ), patch("azure.functions.FunctionApp.register_blueprint"):
             app, container = factory.create_app()
 
             post_hook.assert_called_once_with(app, container)
 
+    def test_create_app_uses_cached_discovery(self):
+        cached = {"registries": [MagicMock], "controllers": [MagicMock]}
+        factory = AppFactory(discovery_cache_dir="cache")
+
+        with patch("azfunc_boot.bootstrap.app_factory.DiscoveryManifest") as mock_manifest, patch(
+            "azfunc_boot.bootstrap.app_factory.RegistryManager.create_registry"
+        ) as mock_registry, patch("azfunc_boot.mvc.controller_discovery.ControllerDiscovery.create") as mock_discovery, patch(
+            "azure.functions.FunctionApp.register_blueprint"
+        ):
+            mock_manifest.return_value.load.return_value = cached
+            factory.create_app()
+
+            assert mock_registry.call_args.kwargs["registry_classes"] == [MagicMock]
+            assert mock_discovery.call_args.kwargs["controller_classes"] == [MagicMock]
+            mock_manifest.return_value.save.assert_not_called()
+
     def test_create_app_pre_setup_hook_error(self):
         def failing_hook(container):
             raise ValueError("Hook error")
@@ -84,20 +101,54 @@ class TestAppFactory:
 
     def test_create_app_controller_error(self):
         with patch("azfunc_boot.bootstrap.app_factory.RegistryManager.create_registry"), patch(
-            "azfunc_boot.bootstrap.app_factory.ControllerDiscovery.create", side_effect=Exception("Controller error")
+            "azfunc_boot.mvc.controller_discovery.ControllerDiscovery.create", side_effect=Exception("Controller error")
         ):
             with pytest.raises(Exception, match="Controller error"):
                 self.factory.create_app()
 
     def test_create_app_function(self):
         with patch("azfunc_boot.bootstrap.app_factory.RegistryManager.create_registry"), patch(
-            "azfunc_boot.bootstrap.app_factory.ControllerDiscovery.create"
+            "azfunc_boot.mvc.controller_discovery.ControllerDiscovery.create"
         ), patch("azure.functions.FunctionApp.register_blueprint"):
             app, container = create_app()
 
             assert app is not None
             assert isinstance(container, DependencyContainer)
 
+    def test_app_context_unpacks_to_app_and_container(self):
+        app = MagicMock()
+        container = MagicMock(spec=DependencyContainer)
+
+        unpacked_app, unpacked_container = AppContext(app, container)
+
+        assert unpacked_app is app
+        assert unpacked_container is container
+
+    def test_app_context_shuts_down_container_on_exit(self):
+        container = MagicMock(spec=DependencyContainer)
+        container.shutdown = AsyncMock()
+
+        async def run():
+            async with AppContext(MagicMock(), container) as (_, ctx_container):
+                assert ctx_container is container
+
+        asyncio.run(run())
+
+        container.shutdown.assert_called_once()
+
+    def test_app_context_shuts_down_container_on_error(self):
+        container = MagicMock(spec=DependencyContainer)
+        container.shutdown = AsyncMock()
+
+        async def run():
+            async with AppContext(MagicMock(), container):
+                raise ValueError("Body error")
+
+        with pytest.raises(ValueError, match="Body error"):
+            asyncio.run(run())
+
+        container.shutdown.assert_called_once()
+
     def test_shutdown_container_success(self):
         container = MagicMock(spec=DependencyContainer)
         container.shutdown = AsyncMock()
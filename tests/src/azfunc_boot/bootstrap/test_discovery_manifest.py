@@ -0,0 +1,97 @@
+import importlib
+import json
+import os
+import sys
+
+from azfunc_boot.bootstrap.discovery_manifest import DiscoveryManifest
+
+
+class ManifestEntry:
+    pass
+
+
+class TestDiscoveryManifest:
+    def setup_method(self):
+        self.package_name = "manifest_test_pkg"
+
+    def _create_package(self, tmp_path, monkeypatch):
+        package_dir = tmp_path / "src" / self.package_name
+        package_dir.mkdir(parents=True)
+        (package_dir / "__init__.py").write_text("")
+        (package_dir / "module.py").write_text("class Entry:\n    pass\n")
+        monkeypatch.syspath_prepend(str(tmp_path / "src"))
+        # Each test imports its own copy of the package
+        for name in list(sys.modules):
+            if name.split(".")[0] == self.package_name:
+                monkeypatch.delitem(sys.modules, name)
+        return package_dir
+
+    def _entry(self):
+        return importlib.import_module(f"{self.package_name}.module").Entry
+
+    def test_load_returns_none_without_manifest(self, tmp_path, monkeypatch):
+        self._create_package(tmp_path, monkeypatch)
+        manifest = DiscoveryManifest(str(tmp_path / "cache"), (self.package_name,))
+
+        assert manifest.load() is None
+
+    def test_save_and_load_round_trip(self, tmp_path, monkeypatch):
+        self._create_package(tmp_path, monkeypatch)
+        cache_dir = str(tmp_path / "cache")
+        entry = self._entry()
+
+        DiscoveryManifest(cache_dir, (self.package_name,)).save({"controllers": [entry]})
+        loaded = DiscoveryManifest(cache_dir, (self.package_name,)).load()
+
+        assert loaded == {"controllers": [entry]}
+        manifest_file = next((tmp_path / "cache").iterdir())
+        assert json.loads(manifest_file.read_text()) == {
+            "controllers": [f"{self.package_name}.module:Entry"]
+        }
+
+    def test_classes_outside_packages_are_not_saved(self, tmp_path, monkeypatch):
+        self._create_package(tmp_path, monkeypatch)
+        cache_dir = tmp_path / "cache"
+
+        DiscoveryManifest(str(cache_dir), (self.package_name,)).save({"controllers": [ManifestEntry]})
+
+        assert not cache_dir.exists()
+
+    def test_load_rejects_classes_outside_packages(self, tmp_path, monkeypatch):
+        self._create_package(tmp_path, monkeypatch)
+        cache_dir = tmp_path / "cache"
+        manifest = DiscoveryManifest(str(cache_dir), (self.package_name,))
+        cache_dir.mkdir()
+        with open(manifest._manifest_path(), "w") as manifest_file:
+            json.dump({"controllers": ["os:system"]}, manifest_file)
+
+        assert manifest.load() is None
+
+    def test_source_change_invalidates_manifest(self, tmp_path, monkeypatch):
+        package_dir = self._create_package(tmp_path, monkeypatch)
+        cache_dir = str(tmp_path / "cache")
+        DiscoveryManifest(cache_dir, (self.package_name,)).save({"controllers": [self._entry()]})
+
+        module_path = package_dir / "module.py"
+        stat = module_path.stat()
+        os.utime(module_path, (stat.st_atime, stat.st_mtime + 10))
+
+        assert DiscoveryManifest(cache_dir, (self.package_name,)).load() is None
+
+    def test_python_version_change_invalidates_manifest(self, tmp_path, monkeypatch):
+        self._create_package(tmp_path, monkeypatch)
+        cache_dir = str(tmp_path / "cache")
+        DiscoveryManifest(cache_dir, (self.package_name,)).save({"controllers": [self._entry()]})
+
+        monkeypatch.setattr("azfunc_boot.bootstrap.discovery_manifest.sys.version", "0.0.0")
+
+        assert DiscoveryManifest(cache_dir, (self.package_name,)).load() is None
+
+    def test_unknown_package_disables_manifest(self, tmp_path):
+        cache_dir = tmp_path / "cache"
+        manifest = DiscoveryManifest(str(cache_dir), ("non_existent_package_xyz",))
+
+        manifest.save({"controllers": [ManifestEntry]})
+
+        assert manifest.load() is None
+        assert not cache_dir.exists()
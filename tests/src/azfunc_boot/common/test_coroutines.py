@@ -0,0 +1,28 @@
+from azfunc_boot.common.coroutines import _is_coroutine_function, is_async_callable
+
+
+class AsyncDisposable:
+    async def dispose(self):
+        pass
+
+
+class SyncDisposable:
+    def dispose(self):
+        pass
+
+
+class TestCoroutines:
+    def test_detects_async_and_sync_callables(self):
+        assert is_async_callable(AsyncDisposable().dispose) is True
+        assert is_async_callable(SyncDisposable().dispose) is False
+
+    def test_bound_methods_share_cache_entry(self):
+        is_async_callable(AsyncDisposable().dispose)
+        hits = _is_coroutine_function.cache_info().hits
+
+        is_async_callable(AsyncDisposable().dispose)
+
+        assert _is_coroutine_function.cache_info().hits == hits + 1
+
+    def test_non_callable_is_not_async(self):
+        assert is_async_callable("not a method") is False
@@ -1,13 +1,15 @@
 import os
+from collections.abc import Mapping
 from unittest.mock import patch
 
 from azfunc_boot.config.configuration import Configuration
 
 
 class TestConfiguration:
-    def test_inherits_from_dict(self):
+    def test_is_read_only_mapping(self):
         config = Configuration()
-        assert isinstance(config, dict)
+        assert isinstance(config, Mapping)
+        assert not isinstance(config, dict)
 
     def test_initializes_with_environment_variables(self):
         with patch.dict(os.environ, {"TEST_KEY": "test_value"}, clear=True):
@@ -34,3 +36,40 @@ class TestConfiguration:
             assert "VAR1" in config
             assert config.get("VAR1") == "value1"
             assert list(config.keys()) == list(test_env.keys())
+
+    def test_does_not_copy_environment(self):
+        with patch.dict(os.environ, {"LIVE_KEY": "old_value"}, clear=True):
+            config = Configuration()
+            os.environ["LIVE_KEY"] = "new_value"
+            assert config["live_key"] == "new_value"
+
+    def test_finds_variables_set_after_first_lookup(self):
+        with patch.dict(os.environ, {"EARLY_VAR": "early"}, clear=True):
+            config = Configuration()
+            assert config["LATE_VAR"] is None
+            assert config["EARLY_VAR"] == "early"
+
+            os.environ["LATE_VAR"] = "x"
+
+            assert config["late_var"] == "x"
+            assert config["LATE_VAR"] == config.get("LATE_VAR")
+            assert "LATE_VAR" in config
+
+    def test_getitem_returns_none_after_variable_is_removed(self):
+        with patch.dict(os.environ, {"GONE_VAR": "value"}, clear=True):
+            config = Configuration()
+            assert config["gone_var"] == "value"
+
+            del os.environ["GONE_VAR"]
+
+            assert config["gone_var"] is None
+
+    def test_misses_do_not_rebuild_index_while_environment_is_unchanged(self):
+        with patch.dict(os.environ, {"SOME_VAR": "value"}, clear=True):
+            config = Configuration()
+            assert config["ABSENT_VAR"] is None
+            index = config._lower_index
+
+            assert config["ABSENT_VAR"] is None
+            assert config["OTHER_ABSENT_VAR"] is None
+            assert config._lower_index is index
@@ -1,13 +1,22 @@
 import asyncio
-from unittest.mock import MagicMock
+import gc
+import threading
+import weakref
+from typing import List
+from unittest.mock import MagicMock, patch
 
 import pytest
 
-from azfunc_boot.di.dependency_injector import DependencyContainer, ServiceLifetime
+from azfunc_boot.di.dependency_injector import (
+    DependencyContainer,
+    ServiceLifetime,
+    _compile_builder,
+    _resolve_plan,
+)
 from azfunc_boot.common.disposable import IDisposable
 from azfunc_boot.common.exceptions.not_found_error import NotFoundError
 from azfunc_boot.common.exceptions.validation_error import ValidationError
-from azfunc_boot.di.scope import ScopeManager
+from azfunc_boot.di.scope import Scope, ScopeManager
 
 
 class MockService:
@@ -124,6 +133,13 @@ class TestDependencyInjector:
         assert len(services) == 2
         assert all(isinstance(s, MockService) for s in services)
 
+    def test_single_registration_is_not_wrapped_in_list(self):
+        self.container.add_transient(MockService)
+        assert not isinstance(self.container._services[MockService], list)
+
+        self.container.add_transient(MockService)
+        assert len(self.container._services[MockService]) == 2
+
     def test_scoped_service_requires_scope(self):
         self.container.add_scoped(MockService)
         with pytest.raises(ValidationError) as exc_info:
@@ -140,6 +156,24 @@ class TestDependencyInjector:
         finally:
             ScopeManager.clear_current_scope()
 
+    def test_scoped_disposable_is_tracked_in_scope(self):
+        class ScopedDisposable(IDisposable):
+            def __init__(self):
+                pass
+
+            def dispose(self):
+                pass
+
+        self.container.add_scoped(ScopedDisposable)
+        self.container.add_scoped(MockService)
+        scope = Scope()
+
+        disposable = self.container.get_service(ScopedDisposable, scope)
+        self.container.get_service(MockService, scope)
+
+        assert scope.sync_disposables == [disposable]
+        assert scope.async_disposables == []
+
     def test_create_instance_with_list_dependency(self):
         class BaseStrategy:
             pass
@@ -164,6 +198,21 @@ class TestDependencyInjector:
         assert isinstance(service.strategies[0], StrategyA)
         assert isinstance(service.strategies[1], StrategyB)
 
+    def test_create_instance_with_typing_list_dependency(self):
+        class BaseStrategy:
+            pass
+
+        class ServiceWithList:
+            def __init__(self, strategies: List[BaseStrategy]):
+                self.strategies = strategies
+
+        self.container.add_transient(BaseStrategy, lambda: BaseStrategy())
+        self.container.add_transient(ServiceWithList)
+
+        service = self.container.get_service(ServiceWithList)
+        assert len(service.strategies) == 1
+        assert isinstance(service.strategies[0], BaseStrategy)
+
     def test_create_instance_with_single_list_dependency(self):
         class BaseStrategy:
             pass
@@ -199,11 +248,30 @@ class TestDependencyInjector:
         service2 = self.container.get_service(MockService)
         assert service1 is not service2
 
-    def test_unknown_lifetime_raises_error(self):
-        self.container.add_service(MockService, lambda: MockService(), lifetime="unknown")
+    def test_unknown_lifetime_raises_error_on_registration(self):
         with pytest.raises(ValidationError) as exc_info:
-            self.container.get_service(MockService)
+            self.container.add_service(MockService, lambda: MockService(), lifetime="unknown")
         assert "Unknown lifetime type" in str(exc_info.value)
+        assert MockService not in self.container._services
+
+    @pytest.mark.parametrize("lifetime", [True, False])
+    def test_bool_lifetime_raises_error(self, lifetime):
+        with pytest.raises(ValidationError):
+            self.container.add_service(MockService, lambda: MockService(), lifetime=lifetime)
+
+    def test_unknown_lifetime_in_bulk_registers_nothing(self):
+        with pytest.raises(ValidationError):
+            self.container.add_services_bulk(
+                [(MockService, None, ServiceLifetime.SINGLETON), (MockService, None, 7)]
+            )
+        assert MockService not in self.container._services
+
+    def test_add_service_accepts_lifetime_names(self):
+        self.container.add_service(MockService, lambda: MockService(), lifetime="singleton")
+        self.container.add_service(str, lambda: object(), lifetime="transient")
+
+        assert self.container.get_service(MockService) is self.container.get_service(MockService)
+        assert self.container.get_service(str) is not self.container.get_service(str)
 
     def test_shutdown_with_async_dispose(self):
         class ClassA(IDisposable):
@@ -292,3 +360,257 @@ class TestDependencyInjector:
         service2 = self.container.get_service(MockService, scope)
         assert factory_called == 1  # Factory called only once per scope
         assert service1 is service2
+
+    def test_create_instance_caches_constructor_plan(self):
+        class ClassA:
+            def __init__(self):
+                self.value = 0
+
+        class ClassB:
+            def __init__(self, a: ClassA):
+                self.a = a
+
+        self.container.add_transient(ClassA)
+        self.container.add_transient(ClassB)
+
+        first = self.container.get_service(ClassB)
+        builder = _compile_builder(ClassB)
+        second = self.container.get_service(ClassB)
+
+        assert _compile_builder(ClassB) is builder
+        assert _resolve_plan(ClassB) == ((ClassA, False),)
+        assert first is not second
+        assert isinstance(second.a, ClassA)
+
+    def test_compiled_builder_does_not_keep_class_alive(self):
+        class ClassA:
+            def __init__(self, service: MockService):
+                self.service = service
+
+        self.container.add_transient(MockService)
+        self.container.add_transient(ClassA)
+        self.container.get_service(ClassA)
+        reference = weakref.ref(ClassA)
+
+        del ClassA
+        self.container = DependencyContainer()
+        gc.collect()
+
+        assert reference() is None
+
+    def test_only_disposable_singletons_are_tracked(self):
+        class ClassA(IDisposable):
+            def __init__(self):
+                self.value = 0
+
+            def dispose(self):
+                self.value = 1
+
+        self.container.add_singleton(ClassA)
+        self.container.add_singleton(MockService)
+
+        service_a = self.container.get_service(ClassA)
+        self.container.get_service(ClassA)
+        self.container.get_service(MockService)
+
+        assert self.container._disposables == [service_a]
+
+    def test_shutdown_disposes_structural_disposables(self):
+        class Structural:
+            def __init__(self):
+                self.value = 0
+
+            def dispose(self):
+                self.value = 1
+
+        self.container.add_singleton(Structural)
+        service = self.container.get_service(Structural)
+
+        asyncio.run(self.container.shutdown())
+
+        assert service.value == 1
+
+    def test_shutdown_runs_async_disposes_concurrently(self):
+        started = []
+
+        class ClassA(IDisposable):
+            async def dispose(self):
+                started.append("a")
+                await asyncio.sleep(0)
+                # ClassB must have started before ClassA finishes
+                assert "b" in started
+
+        class ClassB(IDisposable):
+            async def dispose(self):
+                started.append("b")
+                await asyncio.sleep(0)
+
+        self.container.add_singleton(ClassA, lambda: ClassA())
+        self.container.add_singleton(ClassB, lambda: ClassB())
+        self.container.get_service(ClassA)
+        self.container.get_service(ClassB)
+
+        asyncio.run(self.container.shutdown())
+
+        assert started == ["a", "b"]
+
+    def test_shutdown_reraises_dispose_error_after_all_disposes(self):
+        class Failing(IDisposable):
+            async def dispose(self):
+                raise ValueError("dispose failed")
+
+        class ClassB(IDisposable):
+            def __init__(self):
+                self.value = 0
+
+            async def dispose(self):
+                self.value = 1
+
+        self.container.add_singleton(Failing, lambda: Failing())
+        self.container.add_singleton(ClassB)
+        self.container.get_service(Failing)
+        service_b = self.container.get_service(ClassB)
+
+        with pytest.raises(ValueError, match="dispose failed"):
+            asyncio.run(self.container.shutdown())
+        assert service_b.value == 1
+
+    def test_shutdown_awaits_async_disposes_when_sync_dispose_fails(self):
+        class ClassA(IDisposable):
+            def __init__(self):
+                self.value = 0
+
+            async def dispose(self):
+                self.value = 1
+
+        class Failing(IDisposable):
+            def dispose(self):
+                raise ValueError("dispose failed")
+
+        self.container.add_singleton(ClassA)
+        self.container.add_singleton(Failing, lambda: Failing())
+        service_a = self.container.get_service(ClassA)
+        self.container.get_service(Failing)
+
+        with pytest.raises(ValueError, match="dispose failed"):
+            asyncio.run(self.container.shutdown())
+        assert service_a.value == 1
+
+    def test_singleton_factory_called_once_across_threads(self):
+        calls = 0
+        barrier = threading.Barrier(8)
+
+        def factory():
+            nonlocal calls
+            calls += 1
+            return MockService()
+
+        self.container.add_singleton(MockService, factory)
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(self.container.get_service(MockService))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+
+    def test_precompile_builds_plans_for_auto_injected_services(self):
+        class ClassA:
+            def __init__(self):
+                self.value = 0
+
+        class ClassB:
+            def __init__(self, a: ClassA):
+                self.a = a
+
+        class ServiceWithoutAnnotation:
+            def __init__(self, param):
+                self.param = param
+
+        self.container.add_singleton(ClassA)
+        self.container.add_scoped(ClassB)
+        self.container.add_transient(MockService, lambda: MockService())
+        self.container.add_transient(ServiceWithoutAnnotation)
+
+        with patch(
+            "azfunc_boot.di.dependency_injector._resolve_plan", wraps=_resolve_plan
+        ) as mock_plan:
+            self.container.precompile()
+
+        planned = [c.args[0] for c in mock_plan.call_args_list]
+        assert planned == [ClassA, ClassB, ServiceWithoutAnnotation]
+        with pytest.raises(ValidationError):
+            self.container.get_service(ServiceWithoutAnnotation)
+
+    def test_add_services_bulk(self):
+        class ClassA:
+            def __init__(self):
+                self.value = 0
+
+        self.container.add_transient(MockService)
+        self.container.add_services_bulk(
+            [
+                (ClassA, None, ServiceLifetime.SINGLETON),
+                (MockService, lambda: MockService(), ServiceLifetime.TRANSIENT),
+            ]
+        )
+
+        assert self.container.get_service(ClassA) is self.container.get_service(ClassA)
+        services = self.container.get_service(MockService)
+        assert len(services) == 2
+        assert all(isinstance(s, MockService) for s in services)
+
+    def test_freeze_resolves_single_and_multiple_registrations(self):
+        self.container.add_singleton(MockService)
+        self.container.add_transient(dict, lambda: {})
+        self.container.add_transient(dict, lambda: {})
+
+        self.container.freeze()
+
+        assert self.container.get_service(MockService) is self.container.get_service(MockService)
+        assert self.container.get_service(dict) == [{}, {}]
+        with pytest.raises(NotFoundError):
+            self.container.get_service(list)
+
+    def test_freeze_rejects_new_registrations(self):
+        self.container.freeze()
+
+        with pytest.raises(ValidationError):
+            self.container.add_service(MockService, lambda: MockService())
+        with pytest.raises(ValidationError):
+            self.container.add_services_bulk([(MockService, None, ServiceLifetime.SINGLETON)])
+
+    def test_resolver_cache_invalidated_by_new_registration(self):
+        self.container.add_transient(MockService)
+        assert isinstance(self.container.get_service(MockService), MockService)
+        assert MockService in self.container._resolvers
+
+        self.container.add_transient(MockService)
+        services = self.container.get_service(MockService)
+
+        assert isinstance(services, list)
+        assert len(services) == 2
+
+    def test_prewarm_singletons_creates_instances_up_front(self):
+        created = []
+
+        def factory():
+            created.append(True)
+            return MockService()
+
+        self.container.add_singleton(MockService, factory)
+        self.container.add_transient(dict, lambda: {})
+
+        self.container.prewarm_singletons()
+
+        assert len(created) == 1
+        service = self.container.get_service(MockService)
+        assert service is self.container._singletons[MockService]
+        assert len(created) == 1
@@ -1,5 +1,6 @@
 import asyncio
-from azfunc_boot.di.scope import ScopeManager
+import pytest
+from azfunc_boot.di.scope import Scope, ScopeManager
 from azfunc_boot.common.disposable import IDisposable
 
 
@@ -43,9 +44,18 @@ class TestScopeManager:
 
     def test_create_scope(self):
         scope = ScopeManager.create_scope()
-        assert isinstance(scope, dict)
+        assert isinstance(scope, Scope)
         assert len(scope) == 0
 
+    def test_create_scope_returns_fresh_scope(self):
+        scope = ScopeManager.create_scope()
+        scope[MockService] = MockService()
+
+        other = ScopeManager.create_scope()
+
+        assert other is not scope
+        assert len(other) == 0
+
     def test_set_and_get_current_scope(self):
         scope = ScopeManager.create_scope()
         ScopeManager.set_current_scope(scope)
@@ -65,6 +75,20 @@ class TestScopeManager:
         ScopeManager.clear_current_scope()
         assert ScopeManager.get_current_scope() is None
 
+    def test_reset_current_scope_restores_previous_scope(self):
+        outer = ScopeManager.create_scope()
+        inner = ScopeManager.create_scope()
+
+        outer_token = ScopeManager.set_current_scope(outer)
+        inner_token = ScopeManager.set_current_scope(inner)
+        assert ScopeManager.get_current_scope() is inner
+
+        ScopeManager.reset_current_scope(inner_token)
+        assert ScopeManager.get_current_scope() is outer
+
+        ScopeManager.reset_current_scope(outer_token)
+        assert ScopeManager.get_current_scope() is None
+
     def test_multiple_scopes_are_independent(self):
         scope1 = ScopeManager.create_scope()
         scope2 = ScopeManager.create_scope()
@@ -229,3 +253,100 @@ class TestScopeManager:
         asyncio.run(ScopeManager._dispose_instance(obj))
         assert hasattr(obj, "disposed")
         # Note: dispose_scope only disposes IDisposable instances
+
+    def test_dispose_scope_detects_dispose_structurally(self):
+        class StructuralDisposable:
+            def dispose(self):
+                self.disposed = True
+
+        class NotDisposable:
+            dispose = None
+
+        structural = StructuralDisposable()
+        scope = {StructuralDisposable: structural, NotDisposable: NotDisposable()}
+
+        asyncio.run(ScopeManager.dispose_scope(scope))
+
+        assert structural.disposed
+        assert isinstance(structural, IDisposable)
+
+    def test_dispose_scope_walks_tracked_disposables(self):
+        scope = Scope()
+        sync_disposable = MockDisposable()
+        async_disposable = MockAsyncDisposable()
+        ScopeManager.track_disposable(scope, sync_disposable)
+        ScopeManager.track_disposable(scope, async_disposable)
+
+        asyncio.run(ScopeManager.dispose_scope(scope))
+
+        assert sync_disposable.disposed
+        assert async_disposable.disposed
+
+    def test_scope_records_manually_inserted_disposables(self):
+        scope = ScopeManager.create_scope()
+        inserted = MockDisposable()
+        defaulted = MockAsyncDisposable()
+        scope["inserted"] = inserted
+        scope["inserted"] = inserted
+        scope.setdefault("defaulted", defaulted)
+        scope.update(plain=MockService())
+
+        assert scope.sync_disposables == [inserted]
+        assert scope.async_disposables == [defaulted]
+
+        asyncio.run(ScopeManager.dispose_scope(scope))
+
+        assert inserted.disposed
+        assert defaulted.disposed
+
+    def test_dispose_scope_runs_async_disposes_concurrently(self):
+        started = []
+
+        class SlowDisposable(IDisposable):
+            def __init__(self, name):
+                self.name = name
+
+            async def dispose(self):
+                started.append(self.name)
+                await asyncio.sleep(0)
+                # Every dispose must have started before the first one finishes
+                assert len(started) == 2
+
+        scope = ScopeManager.create_scope()
+        scope["a"] = SlowDisposable("a")
+        scope["b"] = SlowDisposable("b")
+
+        asyncio.run(ScopeManager.dispose_scope(scope))
+
+        assert started == ["a", "b"]
+
+    def test_dispose_scope_reraises_error_after_all_disposes(self):
+        class FailingDisposable(IDisposable):
+            async def dispose(self):
+                raise ValueError("dispose failed")
+
+        scope = ScopeManager.create_scope()
+        scope[FailingDisposable] = FailingDisposable()
+        other = MockAsyncDisposable()
+        scope[MockAsyncDisposable] = other
+
+        with pytest.raises(ValueError, match="dispose failed"):
+            asyncio.run(ScopeManager.dispose_scope(scope))
+        assert other.disposed
+
+    def test_dispose_scope_runs_all_disposes_when_sync_dispose_fails(self):
+        class FailingDisposable(IDisposable):
+            def dispose(self):
+                raise ValueError("dispose failed")
+
+        scope = ScopeManager.create_scope()
+        scope[FailingDisposable] = FailingDisposable()
+        sync_disposable = MockDisposable()
+        async_disposable = MockAsyncDisposable()
+        scope[MockDisposable] = sync_disposable
+        scope[MockAsyncDisposable] = async_disposable
+
+        with pytest.raises(ValueError, match="dispose failed"):
+            asyncio.run(ScopeManager.dispose_scope(scope))
+        assert sync_disposable.disposed
+        assert async_disposable.disposed
@@ -1,4 +1,5 @@
 import asyncio
+import json
 
 import pytest
 from unittest.mock import MagicMock, patch
@@ -19,6 +20,19 @@ class MockController(BaseController):
         self.register_routes_called = True
 
 
+class MockDisposable(IDisposable):
+    def __init__(self):
+        self.dispose_calls = 0
+
+    def dispose(self):
+        self.dispose_calls += 1
+
+
+class MockAsyncDisposable(IDisposable):
+    async def dispose(self):
+        await asyncio.sleep(0)
+
+
 class TestBaseController:
     def setup_method(self):
         self.container_mock = MagicMock(spec=DependencyContainer)
@@ -51,6 +65,29 @@ class TestBaseController:
 
         assert result == "testvalue"
 
+    def test_wrap_with_scope_reuses_wrapper_for_same_method(self):
+        def sync_method():
+            return "result"
+
+        wrapped = self.controller._wrap_with_scope(sync_method)
+
+        assert self.controller._wrap_with_scope(sync_method) is wrapped
+
+    def test_sync_wrapper_warns_once_when_returning_coroutine(self):
+        async def coroutine():
+            pass
+
+        def sync_method():
+            return coroutine()
+
+        wrapped = self.controller._wrap_with_scope(sync_method)
+
+        with patch("azfunc_boot.mvc.base_controller.logging.warning") as mock_warning:
+            wrapped().close()
+            wrapped().close()
+
+        mock_warning.assert_called_once()
+
     def test_async_wrapper_handles_exception(self):
         async def async_method():
             raise ValueError("test error")
@@ -70,29 +107,26 @@ class TestBaseController:
             wrapped()
 
     def test_dispose_scope_sync_calls_dispose_on_sync_disposable(self):
-        disposable_mock = MagicMock(spec=IDisposable)
-        disposable_mock.dispose = MagicMock()
-        scope = {type(disposable_mock): disposable_mock}
+        disposable = MockDisposable()
+        scope = {MockDisposable: disposable}
 
         BaseController._dispose_scope_sync(scope)
 
-        disposable_mock.dispose.assert_called_once()
+        assert disposable.dispose_calls == 1
 
     def test_dispose_scope_sync_with_empty_scope(self):
         scope = {}
         BaseController._dispose_scope_sync(scope)
 
     def test_dispose_scope_sync_with_multiple_disposables(self):
-        disposable1 = MagicMock(spec=IDisposable)
-        disposable1.dispose = MagicMock()
-        disposable2 = MagicMock(spec=IDisposable)
-        disposable2.dispose = MagicMock()
-        scope = {type(disposable1): disposable1, type(disposable2): disposable2}
+        disposable1 = MockDisposable()
+        disposable2 = MockDisposable()
+        scope = {"first": disposable1, "second": disposable2}
 
         BaseController._dispose_scope_sync(scope)
 
-        disposable1.dispose.assert_called_once()
-        disposable2.dispose.assert_called_once()
+        assert disposable1.dispose_calls == 1
+        assert disposable2.dispose_calls == 1
 
     def test_json_response(self):
         data = {"key": "value"}
@@ -111,6 +145,11 @@ class TestBaseController:
         assert "error" in body
         assert "Error message" in body
 
+    def test_error_response_body_matches_json_dumps(self):
+        response = self.controller._error_response("Not Found", 404)
+
+        assert response.get_body().decode() == json.dumps({"error": "Not Found"})
+
     def test_async_wrapper_creates_and_disposes_scope(self):
         async def async_method():
             await asyncio.sleep(0)
@@ -136,14 +175,51 @@ class TestBaseController:
         assert result == "result"
         assert ScopeManager.get_current_scope() is None
 
-    def test_dispose_scope_sync_with_async_disposable(self):
-        async_disposable = MagicMock(spec=IDisposable)
+    def test_async_wrapper_gives_each_invocation_its_own_scope(self):
+        scopes = []
 
-        async def async_dispose():
-            await asyncio.sleep(0)
+        async def async_method():
+            scopes.append(ScopeManager.get_current_scope())
+
+        wrapped = self.controller._wrap_with_scope(async_method)
+        asyncio.run(wrapped())
+        asyncio.run(wrapped())
+
+        assert scopes[0] is not scopes[1]
+
+    def test_wrappers_dispose_instances_stored_by_handler(self):
+        disposables = []
+
+        def sync_method():
+            disposable = MockDisposable()
+            ScopeManager.get_current_scope()[MockDisposable] = disposable
+            disposables.append(disposable)
 
-        async_disposable.dispose = async_dispose
-        scope = {type(async_disposable): async_disposable}
+        async def async_method():
+            sync_method()
+
+        self.controller._wrap_with_scope(sync_method)()
+        asyncio.run(self.controller._wrap_with_scope(async_method)())
+
+        assert [disposable.dispose_calls for disposable in disposables] == [1, 1]
+
+    def test_sync_wrapper_restores_outer_scope(self):
+        outer = ScopeManager.create_scope()
+        token = ScopeManager.set_current_scope(outer)
+
+        def sync_method():
+            return ScopeManager.get_current_scope()
+
+        try:
+            inner = self.controller._wrap_with_scope(sync_method)()
+
+            assert inner is not outer
+            assert ScopeManager.get_current_scope() is outer
+        finally:
+            ScopeManager.reset_current_scope(token)
+
+    def test_dispose_scope_sync_with_async_disposable(self):
+        scope = {MockAsyncDisposable: MockAsyncDisposable()}
 
         with patch("azfunc_boot.mvc.base_controller.logging.warning") as mock_warning:
             BaseController._dispose_scope_sync(scope)
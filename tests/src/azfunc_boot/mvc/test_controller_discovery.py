@@ -1,9 +1,13 @@
+import importlib
+import re
+import sys
+import threading
 import types
 from unittest.mock import MagicMock, patch
 
 from azfunc_boot.di.dependency_injector import DependencyContainer
 from azfunc_boot.mvc.base_controller import BaseController
-from azfunc_boot.mvc.controller_discovery import ControllerDiscovery
+from azfunc_boot.mvc.controller_discovery import ControllerDiscovery, logger
 
 
 class MockController(BaseController):
@@ -18,10 +22,27 @@ class MockController2(BaseController):
         pass
 
 
+class PackagedController(BaseController):
+    __module__ = "sample_controllers.test_module1"
+
+    def register_routes(self):
+        # Intentionally empty for testing
+        pass
+
+
+class PackagedController2(BaseController):
+    __module__ = "sample_controllers.test_module2"
+
+    def register_routes(self):
+        # Intentionally empty for testing
+        pass
+
+
 class TestControllerDiscovery:
     def setup_method(self):
         self.container = MagicMock(spec=DependencyContainer)
         self.blueprint = MagicMock()
+        ControllerDiscovery.reset_cache()
 
     def test_create(self):
         with patch.object(ControllerDiscovery, "_discover"), patch.object(
@@ -34,6 +55,31 @@ class TestControllerDiscovery:
             assert discovery.controllers_instances == []
             assert discovery.registered_controllers == []
 
+    def test_init_with_known_controller_classes_skips_discovery(self):
+        with patch.object(ControllerDiscovery, "_discover") as mock_discover, patch.object(
+            ControllerDiscovery, "_register_all_controllers"
+        ):
+            discovery = ControllerDiscovery(
+                self.container,
+                self.blueprint,
+                "test_package",
+                controller_classes=[MockController, MockController2, MockController],
+            )
+
+            mock_discover.assert_not_called()
+            assert discovery.registered_controllers == [MockController, MockController2]
+            assert discovery._registered_set == {MockController, MockController2}
+
+    def test_create_returns_new_instance_and_reuses_cached_walk(self):
+        with patch.object(ControllerDiscovery, "_walk_package") as mock_walk, patch.object(
+            ControllerDiscovery, "_register_all_controllers"
+        ):
+            first = ControllerDiscovery.create(self.container, self.blueprint, "test_package")
+            second = ControllerDiscovery.create(self.container, self.blueprint, "test_package")
+
+            assert first is not second
+            mock_walk.assert_called_once()
+
     def test_register_single_controller(self):
         with patch.object(ControllerDiscovery, "_discover"):
             discovery = ControllerDiscovery(self.container, self.blueprint, "test_package")
@@ -56,6 +102,18 @@ class TestControllerDiscovery:
             assert isinstance(discovery.controllers_instances[0], MockController)
             assert isinstance(discovery.controllers_instances[1], MockController2)
 
+    def test_register_all_controllers_logs_single_summary(self):
+        with patch.object(ControllerDiscovery, "_discover"):
+            discovery = ControllerDiscovery(self.container, self.blueprint, "test_package")
+            discovery.registered_controllers.extend([MockController, MockController2])
+
+            with patch.object(logger, "info") as mock_info:
+                discovery._register_all_controllers()
+
+            mock_info.assert_called_once_with(
+                "Registered %d controllers: %s", 2, "MockController, MockController2"
+            )
+
     def test_no_controllers_available(self):
         with patch.object(ControllerDiscovery, "_discover"):
             discovery = ControllerDiscovery(self.container, self.blueprint, "test_package")
@@ -89,7 +147,7 @@ class TestControllerDiscovery:
         mock_package.__name__ = "test_package"
 
         with patch("azfunc_boot.mvc.controller_discovery.importlib.import_module") as mock_import, patch(
-            "azfunc_boot.mvc.controller_discovery.pkgutil.walk_packages"
+            "azfunc_boot.mvc.controller_discovery.pkgutil.iter_modules"
         ) as mock_walk, patch.object(ControllerDiscovery, "_register_all_controllers"):
             def import_side_effect(name):
                 if name == "test_package":
@@ -162,6 +220,18 @@ class TestControllerDiscovery:
 
                 assert result is mock_module
 
+    def test_import_module_safely_returns_loaded_module(self):
+        with patch.object(ControllerDiscovery, "_discover"), patch.object(
+            ControllerDiscovery, "_register_all_controllers"
+        ):
+            discovery = ControllerDiscovery(self.container, self.blueprint, "test_package")
+
+            with patch("azfunc_boot.mvc.controller_discovery.importlib.import_module") as mock_import:
+                result = discovery._import_module_safely(__name__)
+
+                assert result is sys.modules[__name__]
+                mock_import.assert_not_called()
+
     def test_import_module_safely_error(self):
         with patch.object(ControllerDiscovery, "_discover"), patch.object(
             ControllerDiscovery, "_register_all_controllers"
@@ -209,82 +279,250 @@ class TestControllerDiscovery:
 
             assert len(discovery.registered_controllers) == 1
 
-    def test_discover_controllers_in_module(self):
+    def test_discover_controller_subclasses(self):
         with patch.object(ControllerDiscovery, "_discover"), patch.object(
             ControllerDiscovery, "_register_all_controllers"
         ):
-            discovery = ControllerDiscovery(self.container, self.blueprint, "test_package")
-            mock_module = types.ModuleType("test_module")
-            mock_module.MockController = MockController
+            discovery = ControllerDiscovery(self.container, self.blueprint, "sample_controllers")
 
-            class NotAController:
+            discovery._discover_controller_subclasses("sample_controllers")
+
+            assert discovery.registered_controllers == [PackagedController, PackagedController2]
+            assert MockController not in discovery.registered_controllers
+
+    def test_discover_controller_subclasses_visits_diamond_once(self):
+        class LeftController(BaseController):
+            __module__ = "diamond_controllers.left"
+
+            def register_routes(self):
+                # Intentionally empty for testing
                 pass
 
-            mock_module.NotAController = NotAController
+        class RightController(BaseController):
+            __module__ = "diamond_controllers.right"
 
-            discovery._discover_controllers_in_module(mock_module)
+            def register_routes(self):
+                # Intentionally empty for testing
+                pass
 
-            assert MockController in discovery.registered_controllers
-            assert NotAController not in discovery.registered_controllers
+        class BothController(LeftController, RightController):
+            __module__ = "diamond_controllers.both"
+
+        with patch.object(ControllerDiscovery, "_discover"), patch.object(
+            ControllerDiscovery, "_register_all_controllers"
+        ):
+            discovery = ControllerDiscovery(self.container, self.blueprint, "diamond_controllers")
+
+            with patch.object(
+                discovery, "_is_controller_class", wraps=discovery._is_controller_class
+            ) as mock_is_controller:
+                discovery._discover_controller_subclasses("diamond_controllers")
+
+            assert discovery.registered_controllers == [LeftController, BothController, RightController]
+            assert mock_is_controller.call_count == 3
 
     def test_discover_full_flow(self):
         with patch.object(ControllerDiscovery, "_register_all_controllers"):
-            discovery = ControllerDiscovery(self.container, self.blueprint, "test_package")
-            mock_module = types.ModuleType("test_module")
-            mock_module.MockController = MockController
-            mock_module.MockController2 = MockController2
+            discovery = ControllerDiscovery(self.container, self.blueprint, "sample_controllers")
+            mock_module = types.ModuleType("sample_controllers.test_module1")
 
-            with patch.object(discovery, "_get_package_info", return_value=(["fake_path"], "test_package.")), patch(
-                "azfunc_boot.mvc.controller_discovery.pkgutil.walk_packages"
+            with patch.object(discovery, "_get_package_info", return_value=(["fake_path"], "sample_controllers.")), patch(
+                "azfunc_boot.mvc.controller_discovery.pkgutil.iter_modules"
             ) as mock_walk, patch.object(discovery, "_import_module_safely", return_value=mock_module):
-                mock_walk.return_value = [(None, "test_module", False)]
+                mock_walk.return_value = [(None, "sample_controllers.test_module1", False)]
 
-                discovery._discover("test_package")
+                discovery._walk_package("sample_controllers")
 
-                assert MockController in discovery.registered_controllers
-                assert MockController2 in discovery.registered_controllers
+                assert PackagedController in discovery.registered_controllers
+                assert PackagedController2 in discovery.registered_controllers
                 assert len(discovery.registered_controllers) == 2
 
     def test_discover_processes_multiple_modules(self):
         with patch.object(ControllerDiscovery, "_register_all_controllers"):
-            discovery = ControllerDiscovery(self.container, self.blueprint, "test_package")
-            mock_module1 = types.ModuleType("test_module1")
-            mock_module1.MockController = MockController
-            mock_module2 = types.ModuleType("test_module2")
-            mock_module2.MockController2 = MockController2
+            discovery = ControllerDiscovery(self.container, self.blueprint, "sample_controllers")
 
-            with patch.object(discovery, "_get_package_info", return_value=(["fake_path"], "test_package.")), patch(
-                "azfunc_boot.mvc.controller_discovery.pkgutil.walk_packages"
+            with patch.object(discovery, "_get_package_info", return_value=(["fake_path"], "sample_controllers.")), patch(
+                "azfunc_boot.mvc.controller_discovery.pkgutil.iter_modules"
             ) as mock_walk, patch.object(discovery, "_import_module_safely") as mock_import:
                 mock_walk.return_value = [
-                    (None, "test_module1", False),
-                    (None, "test_module2", False),
+                    (None, "sample_controllers.test_module1", False),
+                    (None, "sample_controllers.test_module2", False),
                 ]
 
-                def import_side_effect(name):
-                    if "test_module1" in name:
-                        return mock_module1
-                    elif "test_module2" in name:
-                        return mock_module2
-                    return None
+                discovery._walk_package("sample_controllers")
 
-                mock_import.side_effect = import_side_effect
+                assert mock_import.call_count == 2
+                assert PackagedController in discovery.registered_controllers
+                assert PackagedController2 in discovery.registered_controllers
 
-                discovery._discover("test_package")
+    def test_import_modules_imports_in_module_order(self):
+        with patch.object(ControllerDiscovery, "_discover"), patch.object(
+            ControllerDiscovery, "_register_all_controllers"
+        ):
+            discovery = ControllerDiscovery(self.container, self.blueprint, "sample_controllers")
 
-                assert mock_import.call_count == 2
-                assert MockController in discovery.registered_controllers
-                assert MockController2 in discovery.registered_controllers
+        module_names = [f"sample_controllers.module{i}" for i in range(12)]
+        with patch.object(discovery, "_import_module_safely") as mock_import:
+            discovery._import_modules(module_names)
+
+        assert [call.args[0] for call in mock_import.call_args_list] == module_names
+
+    def test_discover_imports_only_modules_matching_pattern(self):
+        with patch.object(ControllerDiscovery, "_discover"), patch.object(
+            ControllerDiscovery, "_register_all_controllers"
+        ):
+            discovery = ControllerDiscovery(
+                self.container,
+                self.blueprint,
+                "sample_controllers",
+                module_pattern=re.compile(r"_controller$"),
+            )
+
+        with patch.object(discovery, "_get_package_info", return_value=(["fake_path"], "sample_controllers.")), patch(
+            "azfunc_boot.mvc.controller_discovery.pkgutil.iter_modules"
+        ) as mock_iter, patch.object(discovery, "_import_module_safely") as mock_import:
+            mock_iter.return_value = [
+                (None, "sample_controllers.users_controller", False),
+                (None, "sample_controllers.helpers", False),
+            ]
+
+            discovery._walk_package("sample_controllers")
+
+            mock_import.assert_called_once_with("sample_controllers.users_controller")
+
+    def test_discover_skips_loaded_modules_not_matching_pattern(self, tmp_path, monkeypatch):
+        package_dir = tmp_path / "pattern_controllers"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("")
+        controller_source = (
+            "from azfunc_boot.mvc.base_controller import BaseController\n\n"
+            "class {name}(BaseController):\n"
+            "    def register_routes(self):\n"
+            "        pass\n"
+        )
+        (package_dir / "users_controller.py").write_text(controller_source.format(name="UsersController"))
+        (package_dir / "helper.py").write_text(controller_source.format(name="HelperController"))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        importlib.import_module("pattern_controllers.helper")
+
+        with patch.object(ControllerDiscovery, "_register_all_controllers"):
+            discovery = ControllerDiscovery(
+                self.container,
+                self.blueprint,
+                "pattern_controllers",
+                module_pattern=re.compile(r"_controller$"),
+            )
+
+        assert [cls.__name__ for cls in discovery.registered_controllers] == ["UsersController"]
+
+    def test_discover_allows_discovery_from_imported_module(self, tmp_path, monkeypatch):
+        (tmp_path / "nested_discovery_inner").mkdir()
+        (tmp_path / "nested_discovery_inner" / "__init__.py").write_text("")
+        outer_dir = tmp_path / "nested_discovery_outer"
+        outer_dir.mkdir()
+        (outer_dir / "__init__.py").write_text("")
+        (outer_dir / "boot.py").write_text(
+            "from unittest.mock import MagicMock\n"
+            "from azfunc_boot.mvc.controller_discovery import ControllerDiscovery\n"
+            "ControllerDiscovery(MagicMock(), MagicMock(), 'nested_discovery_inner')\n"
+        )
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        worker = threading.Thread(
+            target=ControllerDiscovery,
+            args=(self.container, self.blueprint, "nested_discovery_outer"),
+            daemon=True,
+        )
+        worker.start()
+        worker.join(timeout=5)
+
+        assert not worker.is_alive()
+
+    def test_discover_reuses_cached_walk_for_package(self):
+        with patch.object(ControllerDiscovery, "_register_all_controllers"), patch.object(
+            ControllerDiscovery, "_get_package_info", return_value=(["fake_path"], "sample_controllers.")
+        ), patch("azfunc_boot.mvc.controller_discovery.pkgutil.iter_modules", return_value=[]):
+            first = ControllerDiscovery(self.container, self.blueprint, "sample_controllers")
+
+            with patch.object(ControllerDiscovery, "_walk_package") as mock_walk:
+                second = ControllerDiscovery(self.container, self.blueprint, "sample_controllers")
+
+            mock_walk.assert_not_called()
+            assert second.registered_controllers == first.registered_controllers
+            assert second.registered_controllers == [PackagedController, PackagedController2]
+
+    def test_collect_module_names_descends_into_subpackages(self, tmp_path, monkeypatch):
+        package_dir = tmp_path / "walk_controllers"
+        (package_dir / "nested").mkdir(parents=True)
+        (package_dir / "__init__.py").write_text("")
+        (package_dir / "users.py").write_text("")
+        (package_dir / "nested" / "__init__.py").write_text("")
+        (package_dir / "nested" / "orders.py").write_text("")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        with patch.object(ControllerDiscovery, "_discover"), patch.object(
+            ControllerDiscovery, "_register_all_controllers"
+        ):
+            discovery = ControllerDiscovery(self.container, self.blueprint, "walk_controllers")
+            package_path, package_prefix = discovery._get_package_info("walk_controllers")
+
+            names = discovery._collect_module_names("walk_controllers", package_path, package_prefix)
+            assert names == [
+                "walk_controllers.nested",
+                "walk_controllers.users",
+                "walk_controllers.nested.orders",
+            ]
+
+            with patch.object(discovery, "_should_descend", return_value=False):
+                names = discovery._collect_module_names("walk_controllers", package_path, package_prefix)
+            assert names == ["walk_controllers.nested", "walk_controllers.users"]
+
+    def test_discover_registers_controllers_reexported_from_outside(self, tmp_path, monkeypatch):
+        shared_dir = tmp_path / "shared_controllers_lib"
+        shared_dir.mkdir()
+        (shared_dir / "__init__.py").write_text(
+            "from azfunc_boot.mvc.base_controller import BaseController\n\n"
+            "class SharedController(BaseController):\n"
+            "    def register_routes(self):\n"
+            "        pass\n"
+        )
+        package_dir = tmp_path / "reexport_controllers"
+        package_dir.mkdir()
+        (package_dir / "__init__.py").write_text("")
+        (package_dir / "shared.py").write_text("from shared_controllers_lib import SharedController\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        with patch.object(ControllerDiscovery, "_register_all_controllers"):
+            discovery = ControllerDiscovery(self.container, self.blueprint, "reexport_controllers")
+
+        assert [cls.__name__ for cls in discovery.registered_controllers] == ["SharedController"]
+
+    def test_discover_rewalks_after_new_controller_is_defined(self):
+        with patch.object(ControllerDiscovery, "_register_all_controllers"), patch.object(
+            ControllerDiscovery, "_get_package_info", return_value=(["fake_path"], "late_controllers.")
+        ), patch("azfunc_boot.mvc.controller_discovery.pkgutil.iter_modules", return_value=[]):
+            ControllerDiscovery(self.container, self.blueprint, "late_controllers")
+
+            class LateController(BaseController):
+                __module__ = "late_controllers.late"
+
+                def register_routes(self):
+                    # Intentionally empty for testing
+                    pass
+
+            discovery = ControllerDiscovery(self.container, self.blueprint, "late_controllers")
+
+            assert LateController in discovery.registered_controllers
 
     def test_discover_handles_none_module(self):
         with patch.object(ControllerDiscovery, "_register_all_controllers"):
             discovery = ControllerDiscovery(self.container, self.blueprint, "test_package")
 
             with patch.object(discovery, "_get_package_info", return_value=(["fake_path"], "test_package.")), patch(
-                "azfunc_boot.mvc.controller_discovery.pkgutil.walk_packages"
+                "azfunc_boot.mvc.controller_discovery.pkgutil.iter_modules"
             ) as mock_walk, patch.object(discovery, "_import_module_safely", return_value=None):
                 mock_walk.return_value = [(None, "test_module", False)]
 
-                discovery._discover("test_package")
+                discovery._walk_package("test_package")
 
                 assert len(discovery.registered_controllers) == 0
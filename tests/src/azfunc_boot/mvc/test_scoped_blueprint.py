@@ -1,34 +1,36 @@
+from types import SimpleNamespace
 from unittest.mock import MagicMock
 
 import pytest
 
 from azfunc_boot.mvc.scoped_blueprint import ScopedBlueprint
-from azfunc_boot.mvc.trigger_wrapper import TriggerWrapper
 
 
 class TestScopedBlueprint:
     def setup_method(self):
-        self.mock_blueprint = MagicMock()
-        self.mock_controller = MagicMock()
+        # Plain namespaces: tests only set and read attributes on these doubles
+        self.mock_blueprint = SimpleNamespace()
+        self.mock_controller = SimpleNamespace(_wrap_with_scope=lambda func: func)
 
     def test_init(self):
         scoped_bp = ScopedBlueprint(self.mock_blueprint, self.mock_controller)
 
         assert scoped_bp._blueprint is self.mock_blueprint
         assert scoped_bp._controller is self.mock_controller
-        assert scoped_bp._cached_methods == {}
+        # The wrapped objects are held in slots, leaving the instance dict for triggers
+        assert vars(scoped_bp) == {}
 
-    def test_getattr_with_trigger_method(self):
+    @pytest.mark.parametrize("name", ["route", "timer_trigger", "blob_trigger", "queue_trigger"])
+    def test_getattr_with_trigger_method(self, name):
         mock_trigger = MagicMock()
-        self.mock_blueprint.route = mock_trigger
+        setattr(self.mock_blueprint, name, mock_trigger)
 
         scoped_bp = ScopedBlueprint(self.mock_blueprint, self.mock_controller)
-        result = scoped_bp.route
+        result = getattr(scoped_bp, name)
 
-        assert isinstance(result, TriggerWrapper)
-        assert result._blueprint_wrapper is scoped_bp
-        assert result._original_trigger is mock_trigger
-        assert "route" in scoped_bp._cached_methods
+        assert callable(result)
+        assert result is not mock_trigger
+        assert name in vars(scoped_bp)
 
     def test_getattr_with_non_trigger_method(self):
         mock_method = MagicMock()
@@ -38,7 +40,7 @@ class TestScopedBlueprint:
         result = scoped_bp.register_blueprint
 
         assert result is mock_method
-        assert "register_blueprint" not in scoped_bp._cached_methods
+        assert "register_blueprint" not in vars(scoped_bp)
 
     def test_getattr_with_private_method(self):
         mock_private = MagicMock()
@@ -48,7 +50,7 @@ class TestScopedBlueprint:
         result = scoped_bp._private_method
 
         assert result is mock_private
-        assert "_private_method" not in scoped_bp._cached_methods
+        assert "_private_method" not in vars(scoped_bp)
 
     def test_getattr_with_non_callable_attribute(self):
         self.mock_blueprint.some_attribute = "test_value"
@@ -57,7 +59,7 @@ class TestScopedBlueprint:
         result = scoped_bp.some_attribute
 
         assert result == "test_value"
-        assert "some_attribute" not in scoped_bp._cached_methods
+        assert "some_attribute" not in vars(scoped_bp)
 
     def test_getattr_caches_trigger_methods(self):
         mock_trigger = MagicMock()
@@ -68,9 +70,9 @@ class TestScopedBlueprint:
         result2 = scoped_bp.timer_trigger
 
         assert result1 is result2
-        assert isinstance(result1, TriggerWrapper)
-        assert "timer_trigger" in scoped_bp._cached_methods
-        assert scoped_bp._cached_methods["timer_trigger"] is result1
+        assert callable(result1)
+        assert "timer_trigger" in vars(scoped_bp)
+        assert vars(scoped_bp)["timer_trigger"] is result1
 
     def test_setattr_with_private_attribute(self):
         scoped_bp = ScopedBlueprint(self.mock_blueprint, self.mock_controller)
@@ -87,23 +89,31 @@ class TestScopedBlueprint:
         assert hasattr(self.mock_blueprint, "public_attr")
         assert self.mock_blueprint.public_attr == "test_value"
 
-    def test_getattr_with_different_triggers(self):
-        mock_route = MagicMock()
-        mock_timer = MagicMock()
-        mock_blob = MagicMock()
+    def test_setattr_with_public_attribute_replaces_cached_trigger(self):
+        self.mock_blueprint.route = MagicMock()
+        scoped_bp = ScopedBlueprint(self.mock_blueprint, self.mock_controller)
+        scoped_bp.route
+
+        scoped_bp.route = "replaced"
 
-        self.mock_blueprint.route = mock_route
-        self.mock_blueprint.timer_trigger = mock_timer
-        self.mock_blueprint.blob_trigger = mock_blob
+        assert "route" not in vars(scoped_bp)
+        assert self.mock_blueprint.route == "replaced"
+
+    def test_trigger_wrapper_wraps_function_with_scope(self):
+        mock_wrapped_func = MagicMock()
+        mock_trigger_decorator = MagicMock(return_value=mock_wrapped_func)
+        mock_trigger = MagicMock(return_value=mock_trigger_decorator)
+        self.mock_blueprint.route = mock_trigger
+        self.mock_controller._wrap_with_scope = MagicMock(return_value=mock_wrapped_func)
+
+        def test_func():
+            """Test function"""
+            pass
 
         scoped_bp = ScopedBlueprint(self.mock_blueprint, self.mock_controller)
-        route_wrapper = scoped_bp.route
-        timer_wrapper = scoped_bp.timer_trigger
-        blob_wrapper = scoped_bp.blob_trigger
-
-        assert isinstance(route_wrapper, TriggerWrapper)
-        assert isinstance(timer_wrapper, TriggerWrapper)
-        assert isinstance(blob_wrapper, TriggerWrapper)
-        assert route_wrapper is not timer_wrapper
-        assert timer_wrapper is not blob_wrapper
-        assert len(scoped_bp._cached_methods) == 3
+        result = scoped_bp.route("route_name", auth_level="anonymous")(test_func)
+
+        self.mock_controller._wrap_with_scope.assert_called_once_with(test_func)
+        mock_trigger.assert_called_once_with("route_name", auth_level="anonymous")
+        mock_trigger_decorator.assert_called_once_with(mock_wrapped_func)
+        assert result is mock_wrapped_func
@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from azfunc_boot.registry.base_service_registry import BaseServiceRegistry, register_service
+from azfunc_boot.registry.base_service_registry import BaseServiceRegistry, logger, register_service
 
 
 class MockServiceRegistry(BaseServiceRegistry):
@@ -45,10 +45,37 @@ class TestBaseServiceRegistry:
             def faulty_service(self):
                 raise ValueError("Error en el servicio")
 
-        with patch("azfunc_boot.registry.base_service_registry.logging.error") as mock_error, patch(
-            "azfunc_boot.registry.base_service_registry.logging.info"
-        ) as mock_info:
+        with patch.object(logger, "error") as mock_error, patch.object(logger, "info") as mock_info:
             FaultyServiceRegistry()
 
-            mock_info.assert_called_with("Service registered successfully: good_service")
-            mock_error.assert_called_once_with("Error registering service 'faulty_service': Error en el servicio")
+            mock_info.assert_called_with("Service registered successfully: %s", "good_service")
+            mock_error.assert_called_once()
+            message, name, error = mock_error.call_args.args
+            assert message % (name, error) == "Error registering service 'faulty_service': Error en el servicio"
+
+    def test_subclasses_are_recorded_in_definition_order(self):
+        class FirstRegistry(BaseServiceRegistry):
+            pass
+
+        class SecondRegistry(FirstRegistry):
+            pass
+
+        recorded = BaseServiceRegistry._registry_classes
+        assert MockServiceRegistry in recorded
+        assert recorded[-2:] == [FirstRegistry, SecondRegistry]
+        assert BaseServiceRegistry not in recorded
+
+    def test_register_service_names_are_resolved_per_class(self):
+        class DerivedRegistry(MockServiceRegistry):
+            @property
+            def expensive(self):
+                raise AssertionError("properties must not be evaluated")
+
+            def service_two(self):
+                self.services_called.append("overridden_service_two")
+
+        registry = DerivedRegistry()
+
+        assert DerivedRegistry._register_service_names == ("service_one",)
+        assert registry.services_called == ["service_one"]
+
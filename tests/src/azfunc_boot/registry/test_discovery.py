@@ -1,8 +1,8 @@
-import logging
+import types
 from unittest.mock import MagicMock, patch
 from azfunc_boot.di.dependency_injector import DependencyContainer
 from azfunc_boot.registry.base_service_registry import BaseServiceRegistry
-from azfunc_boot.registry.discovery import RegistryManager
+from azfunc_boot.registry.discovery import RegistryManager, logger
 
 
 class MockServiceRegistry(BaseServiceRegistry):
@@ -15,6 +15,7 @@ class TestRegistryManager:
     def setup_method(self):
         self.container = MagicMock(spec=DependencyContainer)
         self.registry_manager = RegistryManager(self.container, "test_package")
+        RegistryManager.invalidate_cache()
 
     def test_create_registry(self):
         with patch.object(RegistryManager, "register_services") as mock_register:
@@ -34,18 +35,101 @@ class TestRegistryManager:
             self.registry_manager.register_services()
             mock_process.assert_called_once_with(["fake_path"])
 
+    def test_register_services_reuses_discovered_classes(self):
+        def discover(package_path):
+            self.registry_manager._create_registry_instance(MockServiceRegistry)
+
+        with patch.object(self.registry_manager, "_load_base_package", return_value=["fake_path"]), patch.object(
+            self.registry_manager, "_process_all_modules", side_effect=discover
+        ):
+            self.registry_manager.register_services()
+
+        second = RegistryManager(self.container, "test_package")
+        with patch.object(second, "_load_base_package") as mock_load:
+            second.register_services()
+
+        mock_load.assert_not_called()
+        assert isinstance(self.registry_manager.registered_services, list)
+        assert isinstance(second.registered_services, list)
+        assert len(second.registered_services) == 1
+        assert isinstance(second.registered_services[0], MockServiceRegistry)
+
+    def test_register_services_rescans_after_new_registry_is_defined(self):
+        with patch.object(self.registry_manager, "_load_base_package", return_value=["fake_path"]), patch.object(
+            self.registry_manager, "_process_all_modules"
+        ):
+            self.registry_manager.register_services()
+
+        class LateRegistry(MockServiceRegistry):
+            pass
+
+        second = RegistryManager(self.container, "test_package")
+        with patch.object(second, "_load_base_package", return_value=["fake_path"]) as mock_load, patch.object(
+            second, "_process_all_modules"
+        ):
+            second.register_services()
+
+        mock_load.assert_called_once()
+
+    def test_register_services_does_not_cache_after_module_error(self):
+        def discover(package_path):
+            self.registry_manager._process_module("test_package.broken")
+
+        with patch.object(self.registry_manager, "_load_base_package", return_value=["fake_path"]), patch.object(
+            self.registry_manager, "_process_all_modules", side_effect=discover
+        ), patch(
+            "azfunc_boot.registry.discovery._cached_import", side_effect=ImportError("transient")
+        ), patch.object(logger, "error"):
+            self.registry_manager.register_services()
+
+        second = RegistryManager(self.container, "test_package")
+        with patch.object(second, "_load_base_package", return_value=None) as mock_load:
+            second.register_services()
+
+        mock_load.assert_called_once()
+
+    def test_create_registry_with_known_classes_skips_discovery(self):
+        with patch.object(RegistryManager, "register_services") as mock_register, patch.object(
+            logger, "info"
+        ) as mock_info:
+            registry = RegistryManager.create_registry(
+                self.container, "test_package", registry_classes=[MockServiceRegistry]
+            )
+
+            mock_register.assert_not_called()
+            mock_info.assert_not_called()
+            assert len(registry.registered_services) == 1
+            assert registry.registered_services[0].container == self.container
+
     def test_create_registry_instance(self):
-        with patch.object(logging, "info") as mock_info:
+        self.registry_manager._create_registry_instance(MockServiceRegistry)
+
+        assert len(self.registry_manager.registered_services) == 1
+        assert isinstance(self.registry_manager.registered_services[0], MockServiceRegistry)
+        assert self.registry_manager.registered_services[0].container == self.container
+
+    def test_register_services_logs_one_summary(self):
+        class OtherRegistry(MockServiceRegistry):
+            pass
+
+        def discover(package_path):
             self.registry_manager._create_registry_instance(MockServiceRegistry)
+            self.registry_manager._create_registry_instance(OtherRegistry)
 
-            assert len(self.registry_manager.registered_services) == 1
-            assert isinstance(self.registry_manager.registered_services[0], MockServiceRegistry)
-            assert self.registry_manager.registered_services[0].container == self.container
-            mock_info.assert_called_with("Registered services from MockServiceRegistry")
+        with patch.object(self.registry_manager, "_load_base_package", return_value=["fake_path"]), patch.object(
+            self.registry_manager, "_process_all_modules", side_effect=discover
+        ), patch.object(logger, "info") as mock_info:
+            self.registry_manager.register_services()
+
+            mock_info.assert_called_once_with(
+                "Registered services from %d registries: %s",
+                2,
+                "MockServiceRegistry, OtherRegistry",
+            )
 
     def test_register_services_invalid_package(self):
         with patch("azfunc_boot.registry.discovery.importlib.import_module") as mock_import, patch.object(
-            logging, "warning"
+            logger, "warning"
         ) as mock_warning:
             mock_import.side_effect = ImportError("No module named 'invalid'")
 
@@ -55,17 +139,28 @@ class TestRegistryManager:
             assert len(self.registry_manager.registered_services) == 0
             mock_warning.assert_called()
 
+    def test_register_services_missing_package_is_not_imported(self):
+        with patch("azfunc_boot.registry.discovery.importlib.util.find_spec", return_value=None), patch(
+            "azfunc_boot.registry.discovery.importlib.import_module"
+        ) as mock_import, patch.object(logger, "warning") as mock_warning:
+            self.registry_manager.register_services()
+
+            mock_import.assert_not_called()
+            mock_warning.assert_called_once()
+            assert self.registry_manager.registered_services == []
+
     def test_register_services_package_not_valid(self):
-        mock_package = MagicMock()
-        mock_package.__path__ = None
+        mock_spec = MagicMock()
+        mock_spec.submodule_search_locations = None
 
-        with patch("azfunc_boot.registry.discovery.importlib.import_module") as mock_import, patch.object(
-            logging, "warning"
+        with patch(
+            "azfunc_boot.registry.discovery.importlib.util.find_spec", return_value=mock_spec
+        ), patch("azfunc_boot.registry.discovery.importlib.import_module") as mock_import, patch.object(
+            logger, "warning"
         ) as mock_warning:
-            mock_import.return_value = mock_package
-
             self.registry_manager.register_services()
 
+            mock_import.assert_not_called()
             assert len(self.registry_manager.registered_services) == 0
             mock_warning.assert_called()
 
@@ -78,17 +173,39 @@ class TestRegistryManager:
 
         assert self.registry_manager._is_valid_registry_class(NotARegistry) is False
 
+    def test_is_valid_registry_class_sees_new_subclasses(self):
+        assert self.registry_manager._is_valid_registry_class(MockServiceRegistry) is True
+
+        class LateRegistry(MockServiceRegistry):
+            pass
+
+        assert self.registry_manager._is_valid_registry_class(LateRegistry) is True
+
     def test_process_module_import_error(self):
         with patch("azfunc_boot.registry.discovery.importlib.import_module") as mock_import, patch.object(
-            logging, "error"
+            logger, "error"
         ) as mock_error:
             mock_import.side_effect = ImportError("Cannot import")
 
-            self.registry_manager._process_module("test_module")
+            self.registry_manager._process_module("test_package.test_module")
 
             mock_error.assert_called()
             assert len(self.registry_manager.registered_services) == 0
 
+    def test_process_module_logs_module_error(self):
+        error = ValueError("Broken module")
+        with patch(
+            "azfunc_boot.registry.discovery._cached_import", side_effect=error
+        ), patch.object(logger, "error") as mock_error, patch.object(
+            self.registry_manager, "_register_registry_classes"
+        ) as mock_register:
+            self.registry_manager._process_module("test_package.broken")
+
+            mock_register.assert_not_called()
+            mock_error.assert_called_once_with(
+                "Error processing module '%s': %s", "test_package.broken", error
+            )
+
     def test_process_all_modules(self):
         with patch("azfunc_boot.registry.discovery.pkgutil.iter_modules") as mock_iter, patch.object(
             self.registry_manager, "_process_module"
@@ -102,8 +219,41 @@ class TestRegistryManager:
             self.registry_manager._process_all_modules(["fake_path"])
 
             assert mock_process.call_count == 2
-            mock_process.assert_any_call("module1")
-            mock_process.assert_any_call("module2")
+            mock_process.assert_any_call("test_package.module1")
+            mock_process.assert_any_call("test_package.module2")
+
+    def test_process_all_modules_processes_modules_in_order(self):
+        modules = [types.ModuleType(f"test_package.module{i}") for i in range(2)]
+        imports = {module.__name__: module for module in modules}
+
+        def cached_import(name):
+            if name not in imports:
+                raise ImportError("Cannot import")
+            return imports[name]
+
+        with patch("azfunc_boot.registry.discovery.pkgutil.iter_modules") as mock_iter, patch(
+            "azfunc_boot.registry.discovery._cached_import", side_effect=cached_import
+        ), patch.object(logger, "error") as mock_error, patch.object(
+            self.registry_manager, "_register_registry_classes"
+        ) as mock_register:
+            mock_iter.return_value = [(None, f"module{i}", False) for i in range(3)]
+
+            self.registry_manager._process_all_modules(["fake_path"])
+
+            assert [c.args[0] for c in mock_register.call_args_list] == modules
+            mock_error.assert_called_once()
+
+    def test_process_all_modules_scans_package_path_once(self):
+        with patch("azfunc_boot.registry.discovery.pkgutil.iter_modules") as mock_iter, patch.object(
+            self.registry_manager, "_process_module"
+        ) as mock_process:
+            mock_iter.return_value = [(None, "module1", False)]
+
+            self.registry_manager._process_all_modules(["fake_path"])
+            self.registry_manager._process_all_modules(["fake_path"])
+
+            mock_iter.assert_called_once_with(["fake_path"])
+            assert mock_process.call_count == 2
 
     def test_register_registry_classes(self):
         class AnotherRegistry(BaseServiceRegistry):
@@ -114,23 +264,64 @@ class TestRegistryManager:
         class NotARegistry:
             pass
 
-        mock_module = MagicMock()
-        mock_module.MockServiceRegistry = MockServiceRegistry
-        mock_module.AnotherRegistry = AnotherRegistry
-        mock_module.NotARegistry = NotARegistry
+        class ForeignRegistry(BaseServiceRegistry):
+            __module__ = "other_module"
 
-        with patch("azfunc_boot.registry.discovery.inspect.getmembers") as mock_getmembers, patch.object(
-            logging, "info"
-        ) as mock_info:
-            mock_getmembers.return_value = [
-                ("MockServiceRegistry", MockServiceRegistry),
-                ("AnotherRegistry", AnotherRegistry),
-                ("NotARegistry", NotARegistry),
-            ]
+            def __init__(self, container):
+                super().__init__()
+
+        module = types.ModuleType(__name__)
+        module.MockServiceRegistry = MockServiceRegistry
+        module.AnotherRegistry = AnotherRegistry
+        module.NotARegistry = NotARegistry
+        module.ForeignRegistry = ForeignRegistry
+
+        self.registry_manager._register_registry_classes(module)
+
+        assert [type(r) for r in self.registry_manager.registered_services] == [
+            MockServiceRegistry,
+            AnotherRegistry,
+            ForeignRegistry,
+        ]
+
+    def test_register_registry_classes_registers_shared_class_once(self):
+        first = types.ModuleType("test_package.first")
+        first.MockServiceRegistry = MockServiceRegistry
+        second = types.ModuleType("test_package.second")
+        second.MockServiceRegistry = MockServiceRegistry
+
+        self.registry_manager._register_registry_classes(first)
+        self.registry_manager._register_registry_classes(second)
+
+        assert len(self.registry_manager.registered_services) == 1
+
+    def test_register_registry_classes_uses_declared_classes(self):
+        module = types.ModuleType("declared_module")
+        module.__registry_classes__ = (MockServiceRegistry,)
+
+        with patch("azfunc_boot.registry.discovery._known_registries") as mock_lookup:
+            self.registry_manager._register_registry_classes(module)
+
+        mock_lookup.assert_not_called()
+        assert len(self.registry_manager.registered_services) == 1
+        assert isinstance(self.registry_manager.registered_services[0], MockServiceRegistry)
+
+    def test_register_registry_classes_skips_invalid_declared_entries(self):
+        module = types.ModuleType("declared_module")
+        module.__registry_classes__ = ("not a class", dict, MockServiceRegistry)
+
+        with patch.object(logger, "error") as mock_error:
+            self.registry_manager._register_registry_classes(module)
+
+        assert mock_error.call_count == 2
+        assert [type(r) for r in self.registry_manager.registered_services] == [MockServiceRegistry]
+
+    def test_load_base_package_uses_loaded_module(self):
+        self.registry_manager.registries_package = __name__
 
-            self.registry_manager._register_registry_classes(mock_module)
+        with patch("azfunc_boot.registry.discovery.importlib.import_module") as mock_import:
+            package_path = self.registry_manager._load_base_package()
 
-            assert len(self.registry_manager.registered_services) == 2
-            assert isinstance(self.registry_manager.registered_services[0], (MockServiceRegistry, AnotherRegistry))
-            assert isinstance(self.registry_manager.registered_services[1], (MockServiceRegistry, AnotherRegistry))
-            assert mock_info.call_count == 2
+        mock_import.assert_not_called()
+        # A plain module is not a package
+        assert package_path is None